@@ -2,16 +2,115 @@
 Claude AI Adapter - Implements AIProviderPort using Anthropic Claude API.
 This is the "adapter" that connects our port to the external Claude service.
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator, Iterable, NamedTuple
+import asyncio
+import hashlib
 import logging
+import time
 
 from app.ports.ai_provider import AIProviderPort, AIResponse
 from app.models.conversation import ConversationMessage
-from app.models.ai_personality_data import AIPersonalityData
-from app.tools.claude_client import ClaudeClient, PersonalityPrompt
+from app.models.ai_personality_data import AIPersonalityData, LanguageStyle
+from app.tools.claude_client import (
+    ClaudeClient, ClaudeResponse, PersonalityPrompt, get_shared_claude_client
+)
+from app.utils.ttl_cache import TTLCache
+from app.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Number of most recent messages forwarded to Claude as conversation history
+HISTORY_WINDOW = 10
+# Approximate token budget for that history (estimated at ~4 characters per token)
+HISTORY_TOKEN_BUDGET = 1500
+
+# How long a successful health check is reused before pinging the API again
+HEALTH_CHECK_TTL_SECONDS = 30.0
+
+# Response cache settings. Bump the version whenever prompt construction changes
+# so previously cached responses stop matching.
+RESPONSE_CACHE_VERSION = 3
+RESPONSE_CACHE_TTL_SECONDS = 300.0
+RESPONSE_CACHE_MAX_ENTRIES = 512
+# Sampling above this temperature is too varied to replay a cached response, so
+# the cache only serves deployments that lower the claude_temperature setting
+RESPONSE_CACHE_MAX_TEMPERATURE = 0.2
+
+# Consecutive API failures before failing fast, and how long to wait before retrying
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RECOVERY_TIMEOUT_SECONDS = 30.0
+
+# Static prompt fragments shared by every character
+HIGH_ENERGY_GUIDANCE = (
+    "- You use lots of exclamation marks!!!\n"
+    "- You speak quickly and energetically\n"
+    "- You're always looking for the fun angle\n"
+)
+
+TWITTER_GUIDELINES = """
+TWITTER/X RESPONSE GUIDELINES:
+- KEEP RESPONSES SHORT AND PUNCHY (max 1 sentences total! maybe 2 if you have to)
+- Twitter character limit: aim for under 200 characters
+- Start a signature phrase when you want to be punchy and engaging
+- Use hashtags with some of your signature phrases
+- End with a question or call to action
+- Use 2-3 strategic emojis
+- Be authentic and conversational
+- Engage with your audience
+- Show Puerto Rican pride and culture
+
+RESPONSE STRUCTURE (KEEP IT SHORT!):
+1. Signature opening ("¡Este es Jovani!" or similar)
+2. Your quick reaction/opinion (1 sentence max)
+3. Relevant hashtags if appropriate
+
+EXAMPLE GOOD RESPONSE LENGTH:
+"¡Este es Jovani! 🔥 WEPAAA! El conejo malo is coming back home y esto está BRUTAL! 🇵🇷 Q dicen mi gente, nos vemos en el Choli? #BadBunnyEnPR"
+
+"""
+
+
+class _CachedPrompts(NamedTuple):
+    """Prompts built once per personality fingerprint."""
+    fingerprint: int
+    claude_prompt: PersonalityPrompt
+    new_thread_prefix: str
+    thread_reply_prefix: str
+
+
+def _to_claude_history(conversation_history: Optional[List[ConversationMessage]]) -> List[Dict[str, Any]]:
+    """
+    Marshal the most recent conversation messages into Claude's history format.
+    
+    Takes at most HISTORY_WINDOW messages, walking back from the newest until
+    HISTORY_TOKEN_BUDGET is spent, so a few very long messages cannot blow up the
+    prompt. The newest message is always kept and chronological order is preserved.
+    
+    Timestamps are passed through as datetimes; ClaudeClient only renders speaker
+    and content into the prompt, so serializing them per message is wasted work.
+    """
+    if not conversation_history:
+        return []
+    
+    recent_messages = conversation_history[-HISTORY_WINDOW:]
+    start = len(recent_messages) - 1
+    remaining_tokens = HISTORY_TOKEN_BUDGET - len(recent_messages[start].content) // 4
+    while start > 0:
+        remaining_tokens -= len(recent_messages[start - 1].content) // 4
+        if remaining_tokens < 0:
+            break
+        start -= 1
+    
+    return [
+        {
+            "speaker": msg.character_name,
+            "content": msg.content,
+            "timestamp": msg.timestamp
+        }
+        for msg in recent_messages[start:]
+    ]
+
 
 class ClaudeAIAdapter(AIProviderPort):
     """
@@ -23,14 +122,41 @@ class ClaudeAIAdapter(AIProviderPort):
     - Handling Claude-specific logic and error handling
     """
     
-    def __init__(self, claude_client: Optional[ClaudeClient] = None):
+    def __init__(
+        self,
+        claude_client: Optional[ClaudeClient] = None,
+        max_concurrency: Optional[int] = None
+    ):
         """
         Initialize with dependency injection.
         
         Args:
-            claude_client: Injected Claude client (for testing/flexibility)
+            claude_client: Injected Claude client (defaults to the shared process-wide client)
+            max_concurrency: Maximum in-flight Claude calls (defaults to settings)
         """
-        self.claude_client = claude_client or ClaudeClient()
+        self.claude_client = claude_client or get_shared_claude_client()
+        
+        # Bounds concurrent Claude calls across single and batched requests
+        self._semaphore = asyncio.Semaphore(
+            max_concurrency or get_settings().claude_max_concurrency
+        )
+        
+        # character_id -> prompts built for the personality's current fingerprint
+        self._prompt_cache: Dict[str, _CachedPrompts] = {}
+        
+        # Monotonic timestamp of the last successful health check
+        self._last_healthy_at: Optional[float] = None
+        
+        # Skips prompt construction and API calls while Claude is known to be down
+        self._circuit_breaker = CircuitBreaker(
+            failure_threshold=CIRCUIT_FAILURE_THRESHOLD,
+            recovery_timeout=CIRCUIT_RECOVERY_TIMEOUT_SECONDS
+        )
+        
+        # Successful responses for repeated (personality, context, topic) requests
+        self._response_cache = TTLCache(
+            maxsize=RESPONSE_CACHE_MAX_ENTRIES, ttl=RESPONSE_CACHE_TTL_SECONDS
+        )
     
     async def generate_character_response(
         self,
@@ -42,52 +168,62 @@ class ClaudeAIAdapter(AIProviderPort):
         is_new_thread: bool = True
     ) -> AIResponse:
         """Generate character response using Claude API with thread awareness."""
+        # Conversation history makes a request effectively unique, so only cache without it
+        cache_key = None
+        if not conversation_history:
+            cache_key = self._response_cache_key(
+                personality_data, " ".join(context.split()), target_topic, thread_context, is_new_thread
+            )
+            cached_response = self._get_cached_response(cache_key)
+            if cached_response is not None:
+                return cached_response
+        
         try:
+            self._ensure_circuit_closed()
+            
             # Convert our domain model to Claude's format
-            claude_prompt = self._convert_to_claude_prompt(personality_data)
+            prompts = await self._load_prompts(personality_data)
+            claude_prompt = prompts.claude_prompt
             
-            # Enhance context with thread awareness
-            enhanced_context = self._enhance_context_with_thread_awareness(
-                context, thread_context, is_new_thread, personality_data
+            # Split into a cacheable personality prefix and the per-request context
+            system_prefix, enhanced_context = self._enhance_context_with_thread_awareness(
+                context, thread_context, is_new_thread, prompts
             )
             
             # Convert conversation history to Claude format
-            claude_history = []
-            if conversation_history:
-                claude_history = [
-                    {
-                        "speaker": msg.character_name,
-                        "content": msg.content,
-                        "timestamp": msg.timestamp.isoformat()
-                    }
-                    for msg in conversation_history[-10:]  # Last 10 messages
-                ]
+            claude_history = _to_claude_history(conversation_history)
             
             # Call Claude API
-            claude_response = await self.claude_client.generate_character_response(
-                character_prompt=claude_prompt,
-                context=enhanced_context,
-                conversation_history=claude_history,
-                target_topic=target_topic
-            )
+            async with self._semaphore:
+                claude_response = await self.claude_client.generate_character_response(
+                    character_prompt=claude_prompt,
+                    context=enhanced_context,
+                    conversation_history=claude_history,
+                    target_topic=target_topic,
+                    system_prefix=system_prefix
+                )
+            self._record_call_outcome(claude_response)
             
-            # Convert Claude response to our domain model
-            return AIResponse(
+            # Convert Claude response to our domain model (fields already validated by ClaudeResponse)
+            response = AIResponse.model_construct(
                 content=claude_response.content,
                 confidence_score=claude_response.confidence_score,
                 character_consistency=claude_response.character_consistency,
                 metadata={
                     "estimated_tokens": claude_response.estimated_tokens,
                     "response_time_ms": claude_response.response_time_ms,
+                    "cache_read_tokens": claude_response.cache_read_tokens,
                     "provider": "claude",
                     "model": self.claude_client.model,
                     "thread_aware": not is_new_thread,
                     "personality_used": personality_data.character_id
                 }
             )
+            self._cache_response(cache_key, response)
+            return response
             
         except Exception as e:
-            logger.error(f"Error in Claude adapter: {str(e)}")
+            logger.error("Error in Claude adapter: %s", e)
             # Return fallback response
             return AIResponse(
                 content=f"[Error generating response for {personality_data.character_name}]",
@@ -96,6 +232,81 @@ class ClaudeAIAdapter(AIProviderPort):
                 metadata={"error": str(e), "provider": "claude"}
             )
     
+    async def stream_character_response(
+        self,
+        personality_data: AIPersonalityData,
+        context: str,
+        conversation_history: Optional[List[ConversationMessage]] = None,
+        target_topic: Optional[str] = None,
+        thread_context: Optional[str] = None,
+        is_new_thread: bool = True
+    ) -> AsyncIterator[str]:
+        """
+        Stream a character response so callers can act on the first tokens.
+        
+        Takes the same arguments as generate_character_response. Errors are
+        logged and re-raised, because a partially streamed response cannot be
+        swapped for a fallback.
+        
+        Yields:
+            Text chunks in generation order
+        """
+        self._ensure_circuit_closed()
+        
+        prompts = await self._load_prompts(personality_data)
+        claude_prompt = prompts.claude_prompt
+        system_prefix, enhanced_context = self._enhance_context_with_thread_awareness(
+            context, thread_context, is_new_thread, prompts
+        )
+        
+        try:
+            async with self._semaphore:
+                async for chunk in self.claude_client.stream_character_response(
+                    character_prompt=claude_prompt,
+                    context=enhanced_context,
+                    conversation_history=_to_claude_history(conversation_history),
+                    target_topic=target_topic,
+                    system_prefix=system_prefix
+                ):
+                    yield chunk
+        except Exception as e:
+            logger.error("Error streaming Claude response: %s", e)
+            self._circuit_breaker.record_failure()
+            raise
+        
+        self._circuit_breaker.record_success()
+    
+    async def generate_character_responses_batch(
+        self,
+        requests: List[Dict[str, Any]]
+    ) -> List[AIResponse]:
+        """
+        Generate several character responses concurrently.
+        
+        Identical requests are coalesced into a single Claude call and the rest
+        run in parallel, bounded by the adapter's concurrency limit. Prompts for
+        each character are built once through the prompt cache.
+        
+        Args:
+            requests: Keyword arguments for generate_character_response, one dict per request
+            
+        Returns:
+            Responses in the same order as requests
+        """
+        unique_requests: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+        request_keys = []
+        for request in requests:
+            key = self._batch_request_key(request)
+            request_keys.append(key)
+            unique_requests.setdefault(key, request)
+        
+        responses = await asyncio.gather(
+            *(self.generate_character_response(**request) for request in unique_requests.values())
+        )
+        
+        responses_by_key = dict(zip(unique_requests.keys(), responses))
+        return [responses_by_key[key] for key in request_keys]
+    
     async def generate_news_reaction(
         self,
         personality_data: AIPersonalityData,
@@ -104,17 +315,28 @@ class ClaudeAIAdapter(AIProviderPort):
         emotional_context: str = "neutral"
     ) -> AIResponse:
         """Generate news reaction using Claude API."""
+        cache_key = self._response_cache_key(
+            personality_data, news_headline, " ".join(news_content.split()), emotional_context
+        )
+        cached_response = self._get_cached_response(cache_key)
+        if cached_response is not None:
+            return cached_response
+        
         try:
-            claude_prompt = self._convert_to_claude_prompt(personality_data)
+            self._ensure_circuit_closed()
             
-            claude_response = await self.claude_client.generate_news_reaction(
-                character_prompt=claude_prompt,
-                news_headline=news_headline,
-                news_content=news_content,
-                emotional_context=emotional_context
-            )
+            claude_prompt = (await self._load_prompts(personality_data)).claude_prompt
             
-            return AIResponse(
+            async with self._semaphore:
+                claude_response = await self.claude_client.generate_news_reaction(
+                    character_prompt=claude_prompt,
+                    news_headline=news_headline,
+                    news_content=news_content,
+                    emotional_context=emotional_context
+                )
+            self._record_call_outcome(claude_response)
+            
+            response = AIResponse.model_construct(
                 content=claude_response.content,
                 confidence_score=claude_response.confidence_score,
                 character_consistency=claude_response.character_consistency,
@@ -126,9 +348,11 @@ class ClaudeAIAdapter(AIProviderPort):
                     "personality_used": personality_data.character_id
                 }
             )
+            self._cache_response(cache_key, response)
+            return response
             
         except Exception as e:
-            logger.error(f"Error in Claude news reaction: {str(e)}")
+            logger.error("Error in Claude news reaction: %s", e)
             return AIResponse(
                 content="",
                 confidence_score=0.0,
@@ -143,49 +367,202 @@ class ClaudeAIAdapter(AIProviderPort):
     ) -> bool:
         """Validate personality consistency using Claude."""
         try:
-            claude_prompt = self._convert_to_claude_prompt(personality_data)
+            claude_prompt = (await self._load_prompts(personality_data)).claude_prompt
             return await self.claude_client._validate_personality_consistency(
                 claude_prompt, generated_content
             )
         except Exception as e:
-            logger.error(f"Error validating consistency: {str(e)}")
+            logger.error("Error validating consistency: %s", e)
             return False
     
     async def health_check(self) -> bool:
         """Check if Claude API is available."""
+        now = time.monotonic()
+        if self._last_healthy_at is not None and now - self._last_healthy_at < HEALTH_CHECK_TTL_SECONDS:
+            return True
+        
         try:
-            # Simple test call to verify API connectivity
-            from app.models.ai_personality_data import LanguageStyle
-            test_personality = AIPersonalityData(
-                character_id="test",
-                character_name="Test",
-                character_type="test",
-                personality_traits="Test personality",
-                background="Test background",
-                language_style=LanguageStyle.ENGLISH,
-                interaction_style="casual",
-                cultural_context="test context"
-            )
-            
-            response = await self.generate_character_response(
-                personality_data=test_personality,
-                context="Health check test",
-                target_topic="test"
-            )
-            
-            return response.character_consistency is not None
-            
+            # Lightweight metadata call instead of a full generation
+            healthy = await self.claude_client.ping()
         except Exception as e:
-            logger.error(f"Claude health check failed: {str(e)}")
-            return False
+            logger.error("Claude health check failed: %s", e)
+            healthy = False
+        
+        self._last_healthy_at = now if healthy else None
+        return healthy
+    
+    def _ensure_circuit_closed(self) -> None:
+        """Raise CircuitOpenError while the Claude circuit breaker is open."""
+        if not self._circuit_breaker.allow_request():
+            raise CircuitOpenError("Claude API circuit is open")
+    
+    def _record_call_outcome(self, claude_response: ClaudeResponse) -> None:
+        """Feed the result of a Claude call into the circuit breaker."""
+        if claude_response.error:
+            self._circuit_breaker.record_failure()
+        else:
+            self._circuit_breaker.record_success()
+    
+    def _response_cache_key(self, personality_data: AIPersonalityData, *parts: Any) -> Optional[str]:
+        """
+        Build the response cache key for a request, or None when caching is disabled.
+        
+        The key covers the cache version, model, personality fingerprint and the
+        request-specific parts, so prompt or personality edits never replay stale output.
+        """
+        if self.claude_client.temperature > RESPONSE_CACHE_MAX_TEMPERATURE:
+            return None
+        
+        raw_key = "\0".join(str(part) for part in (
+            RESPONSE_CACHE_VERSION,
+            self.claude_client.model,
+            personality_data.character_id,
+            self._personality_fingerprint(personality_data),
+            *parts
+        ))
+        return hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
+    
+    def _get_cached_response(self, cache_key: Optional[str]) -> Optional[AIResponse]:
+        """Return a copy of a cached response tagged as a cache hit."""
+        if cache_key is None:
+            return None
+        
+        cached = self._response_cache.get(cache_key)
+        if cached is None:
+            return None
+        
+        return cached.model_copy(update={"metadata": {**cached.metadata, "cache": "hit"}})
+    
+    def _cache_response(self, cache_key: Optional[str], response: AIResponse) -> None:
+        """Cache a successful response; error fallbacks are never cached."""
+        if cache_key is not None and response.character_consistency:
+            self._response_cache.set(cache_key, response)
+    
+    @staticmethod
+    def _batch_request_key(request: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Key identifying batch requests that would produce the same Claude call."""
+        history = request.get("conversation_history") or ()
+        return (
+            request["personality_data"].character_id,
+            request["context"],
+            request.get("target_topic"),
+            request.get("thread_context"),
+            request.get("is_new_thread", True),
+            tuple((msg.character_name, msg.content) for msg in history[-HISTORY_WINDOW:])
+        )
+    
+    def invalidate_prompt_cache(self, character_id: Optional[str] = None) -> None:
+        """
+        Drop cached prompts after a personality update.
+        
+        Args:
+            character_id: Character to invalidate, or None to clear every character
+        """
+        if character_id is None:
+            self._prompt_cache.clear()
+        else:
+            self._prompt_cache.pop(character_id, None)
+    
+    def prebuild_prompts(self, personalities: Iterable[AIPersonalityData]) -> None:
+        """
+        Build and cache prompts ahead of time, e.g. at application startup.
+        
+        Requests for prebuilt characters then only do a cache lookup on the event loop.
+        """
+        for personality_data in personalities:
+            self._get_cached_prompts(personality_data)
+    
+    def _get_cached_prompts(self, personality_data: AIPersonalityData) -> _CachedPrompts:
+        """
+        Get the Claude prompt and cached system prefixes for a personality.
+        
+        Everything is rebuilt only when the personality fingerprint changes, so
+        repeat requests for the same character skip all prompt construction.
+        """
+        fingerprint = self._personality_fingerprint(personality_data)
+        cached = self._prompt_cache.get(personality_data.character_id)
+        
+        if cached is None or cached.fingerprint != fingerprint:
+            cached = self._build_prompts(personality_data, fingerprint)
+            self._prompt_cache[personality_data.character_id] = cached
+        
+        return cached
+    
+    async def _load_prompts(self, personality_data: AIPersonalityData) -> _CachedPrompts:
+        """
+        Async variant of _get_cached_prompts for request paths.
+        
+        On a cache miss the multi-KB prompt build runs in a worker thread so it
+        does not stall other requests on the event loop.
+        """
+        fingerprint = self._personality_fingerprint(personality_data)
+        cached = self._prompt_cache.get(personality_data.character_id)
+        
+        if cached is None or cached.fingerprint != fingerprint:
+            cached = await asyncio.to_thread(self._build_prompts, personality_data, fingerprint)
+            self._prompt_cache[personality_data.character_id] = cached
+        
+        return cached
+    
+    def _build_prompts(self, personality_data: AIPersonalityData, fingerprint: int) -> _CachedPrompts:
+        """Build every cached prompt for a personality."""
+        personality_prompt = self._generate_character_specific_prompt(personality_data)
+        templates = personality_data.response_templates or {}
+        return _CachedPrompts(
+            fingerprint=fingerprint,
+            claude_prompt=self._convert_to_claude_prompt(personality_data),
+            new_thread_prefix=self._build_system_prefix(
+                personality_prompt, templates.get("new_thread", "")
+            ),
+            thread_reply_prefix=self._build_system_prefix(
+                personality_prompt, templates.get("thread_reply", "")
+            )
+        )
+    
+    @staticmethod
+    def _build_system_prefix(personality_prompt: str, template: str) -> str:
+        """Combine the character prompt with a response template, keeping the template last."""
+        if template:
+            return f"{personality_prompt}\n\n{template}"
+        return personality_prompt
+    
+    @staticmethod
+    def _personality_fingerprint(personality_data: AIPersonalityData) -> int:
+        """Cheap hash over every personality field that feeds the cached prompts."""
+        return hash((
+            personality_data.character_name,
+            personality_data.personality_traits,
+            personality_data.background,
+            personality_data.language_style,
+            tuple(personality_data.topics_of_interest or ()),
+            personality_data.interaction_style,
+            personality_data.cultural_context,
+            tuple(personality_data.signature_phrases or ()),
+            tuple(personality_data.common_expressions or ()),
+            tuple(personality_data.emoji_preferences or ()),
+            tuple(
+                (category, tuple(responses))
+                for category, responses in (personality_data.example_responses or {}).items()
+            ),
+            personality_data.base_energy_level,
+            tuple(personality_data.puerto_rico_references or ()),
+            tuple(personality_data.personality_consistency_rules or ()),
+            tuple(sorted((personality_data.response_templates or {}).items()))
+        ))
     
     def _convert_to_claude_prompt(self, personality_data: AIPersonalityData) -> PersonalityPrompt:
-        """Convert our domain model to Claude's format."""
+        """
+        Convert our domain model to Claude's format.
+        
+        language_style may hold a LanguageStyle member or its value (the model is
+        configured with use_enum_values); LanguageStyle() normalizes both and
+        rejects unknown styles.
+        """
         return PersonalityPrompt(
             character_name=personality_data.character_name,
             personality_traits=personality_data.personality_traits,
             background=personality_data.background,
-            language_style=personality_data.language_style.value if hasattr(personality_data.language_style, 'value') else str(personality_data.language_style),
+            language_style=LanguageStyle(personality_data.language_style).value,
             topics_of_interest=personality_data.topics_of_interest,
             interaction_style=personality_data.interaction_style,
             cultural_context=personality_data.cultural_context
@@ -196,105 +573,87 @@ class ClaudeAIAdapter(AIProviderPort):
         context: str,
         thread_context: Optional[str],
         is_new_thread: bool,
-        personality_data: AIPersonalityData
-    ) -> str:
-        """Enhance context with thread awareness and personality-specific instructions."""
-        
-        enhanced_context = context
-        
-        # Add thread context if this is a reply
-        if thread_context and not is_new_thread:
-            enhanced_context = f"Thread context: {thread_context}\n\nOriginal content: {context}"
+        prompts: _CachedPrompts
+    ) -> Tuple[str, str]:
+        """
+        Enhance context with thread awareness and personality-specific instructions.
         
-        # Add personality-specific response template
+        Returns:
+            Tuple of (cached_prefix, dynamic_suffix). The prefix holds the character
+            prompt and the response template for the thread mode; it only depends on
+            the personality and is sent in the cached system prompt. The suffix is the
+            per-request context (with thread context for replies) for the user message.
+        """
         if is_new_thread:
-            template = personality_data.response_templates.get("new_thread", "")
-        else:
-            template = personality_data.response_templates.get("thread_reply", "")
-        
-        if template:
-            enhanced_context += f"\n\n{template}"
+            return prompts.new_thread_prefix, context
         
-        # Add character-specific personality prompt
-        personality_prompt = self._generate_character_specific_prompt(personality_data)
-        enhanced_context += f"\n\n{personality_prompt}"
+        # Add thread context if this is a reply
+        if thread_context:
+            context = f"Thread context: {thread_context}\n\nOriginal content: {context}"
         
-        return enhanced_context
+        return prompts.thread_reply_prefix, context
     
     def _generate_character_specific_prompt(self, personality_data: AIPersonalityData) -> str:
-        """Generate character-specific personality prompt with detailed instructions."""
+        """
+        Generate character-specific personality prompt with detailed instructions.
+        
+        Signature phrases, common expressions and example response categories are
+        emitted in sorted order. This prompt is part of the cached system prefix, and
+        Anthropic only reuses a cached prefix that is byte-for-byte identical, so its
+        output must not depend on how the personality config was loaded or merged.
+        """
         
-        prompt = f"""DETAILED {personality_data.character_name.upper()} PERSONALITY:
+        name_upper = personality_data.character_name.upper()
+        parts: List[str] = [
+            f"""DETAILED {name_upper} PERSONALITY:
 
-YOU ARE {personality_data.character_name.upper()} - {personality_data.personality_traits}
+YOU ARE {name_upper} - {personality_data.personality_traits}
 
 PLATFORM: You are posting on Twitter/X - keep responses concise, engaging, and social media optimized.
 
 SPEAKING STYLE - YOU MUST USE THESE EXPRESSIONS:
 """
+        ]
         
         # Add signature phrases
-        for phrase in personality_data.signature_phrases:
-            prompt += f'- "{phrase}"\n'
+        parts.extend(f'- "{phrase}"\n' for phrase in sorted(personality_data.signature_phrases))
         
         # Add common expressions
         if personality_data.common_expressions:
-            prompt += f"\nCOMMON EXPRESSIONS: {', '.join(personality_data.common_expressions)}\n"
+            parts.append(f"\nCOMMON EXPRESSIONS: {', '.join(sorted(personality_data.common_expressions))}\n")
         
         # Add emoji preferences
         if personality_data.emoji_preferences:
-            prompt += f"\nEMOJI PREFERENCES: {', '.join(personality_data.emoji_preferences)}\n"
+            parts.append(f"\nEMOJI PREFERENCES: {', '.join(personality_data.emoji_preferences)}\n")
         
         # Add example responses
         if personality_data.example_responses:
-            prompt += "\nTYPICAL RESPONSES YOU WOULD GIVE:\n"
-            for category, responses in personality_data.example_responses.items():
-                prompt += f"\nFor {category.replace('_', ' ').title()}:\n"
-                for response in responses[:2]:  # Show first 2 examples
-                    prompt += f'"{response}"\n'
+            parts.append("\nTYPICAL RESPONSES YOU WOULD GIVE:\n")
+            for category, responses in sorted(personality_data.example_responses.items()):
+                parts.append(f"\nFor {category.replace('_', ' ').title()}:\n")
+                parts.extend(f'"{response}"\n' for response in responses[:2])  # Show first 2 examples
         
         # Add energy level guidance
         energy_desc = "HIGH ENERGY" if personality_data.base_energy_level > 0.7 else "MODERATE ENERGY" if personality_data.base_energy_level > 0.4 else "CALM ENERGY"
-        prompt += f"\nENERGY LEVEL:\n- You are {energy_desc}\n"
+        parts.append(f"\nENERGY LEVEL:\n- You are {energy_desc}\n")
         
         if personality_data.base_energy_level > 0.7:
-            prompt += "- You use lots of exclamation marks!!!\n"
-            prompt += "- You speak quickly and energetically\n"
-            prompt += "- You're always looking for the fun angle\n"
+            parts.append(HIGH_ENERGY_GUIDANCE)
         
         # Add cultural context
         if personality_data.puerto_rico_references:
-            prompt += f"\nPUERTO RICAN REFERENCES: {', '.join(personality_data.puerto_rico_references)}\n"
+            parts.append(f"\nPUERTO RICAN REFERENCES: {', '.join(personality_data.puerto_rico_references)}\n")
         
         # Add validation rules
         if personality_data.personality_consistency_rules:
-            prompt += "\nREMEMBER:\n"
-            for rule in personality_data.personality_consistency_rules:
-                prompt += f"- {rule}\n"
+            parts.append("\nREMEMBER:\n")
+            parts.extend(f"- {rule}\n" for rule in personality_data.personality_consistency_rules)
         
         # Add Twitter/X specific instructions
-        prompt += f"""
-TWITTER/X RESPONSE GUIDELINES:
-- KEEP RESPONSES SHORT AND PUNCHY (max 1 sentences total! maybe 2 if you have to)
-- Twitter character limit: aim for under 200 characters
-- Start a signature phrase when you want to be punchy and engaging
-- Use hashtags with some of your signature phrases
-- End with a question or call to action
-- Use 2-3 strategic emojis
-- Be authentic and conversational
-- Engage with your audience
-- Show Puerto Rican pride and culture
-
-RESPONSE STRUCTURE (KEEP IT SHORT!):
-1. Signature opening ("¡Este es Jovani!" or similar)
-2. Your quick reaction/opinion (1 sentence max)
-3. Relevant hashtags if appropriate
-
-EXAMPLE GOOD RESPONSE LENGTH:
-"¡Este es Jovani! 🔥 WEPAAA! El conejo malo is coming back home y esto está BRUTAL! 🇵🇷 Q dicen mi gente, nos vemos en el Choli? #BadBunnyEnPR"
-
-REMEMBER: You are {personality_data.character_name} - {personality_data.personality_traits}
-KEEP IT SHORT AND SWEET!
-"""
+        parts.append(TWITTER_GUIDELINES)
+        parts.append(
+            f"REMEMBER: You are {personality_data.character_name} - {personality_data.personality_traits}\n"
+            "KEEP IT SHORT AND SWEET!\n"
+        )
         
-        return prompt 
\ No newline at end of file
+        return "".join(parts)
@@ -3,25 +3,65 @@ El Nuevo Día News Adapter - Monitors @ElNuevodia Twitter feed for news.
 Converts tweets into structured news items for AI character reactions.
 """
 import asyncio
+import heapq
 import logging
 import re
-import json
-from typing import List, Optional, Dict, Any
+from collections import Counter
+from itertools import chain
+from typing import List, Optional, Dict, Any, Set, FrozenSet, Tuple, Union
 from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass
+from operator import itemgetter
+
+import orjson
+from pydantic import TypeAdapter
 
 from app.ports.news_provider import NewsProviderPort, NewsItem, TrendingTopic, NewsProviderInfo
+from app.ports.twitter_provider import TwitterSearchResult
 from app.tools.twitter_connector import TwitterConnector
 from app.services.redis_client import RedisClient
+from app.utils.ttl_cache import TTLCache
 from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+UTC = timezone.utc
+
+# In-process cache settings; kept short so entries never lag Redis for long
+LOCAL_CACHE_TTL_SECONDS = 60.0
+LOCAL_CACHE_MAX_ENTRIES = 64
+
+# Tweets fetched per Twitter call. News discovery and trending topics both read
+# from this one cached batch, so serving both costs a single API round-trip
+RECENT_TWEETS_BATCH_SIZE = 50
+
+# (De)serialize cached payloads straight to/from models, without intermediate dicts
+TWEETS_ADAPTER = TypeAdapter(List[TwitterSearchResult])
+TOPICS_ADAPTER = TypeAdapter(List[TrendingTopic])
+
+# Keyword match kinds that are not topic categories
+NEWS_MATCH = "news"
+PR_MATCH = "pr"
+BREAKING_MATCH = "breaking"
+
+PR_KEYWORDS = ["puerto rico", "puerto rican", "boricua", "san juan", "pr", "🇵🇷"]
+BREAKING_KEYWORDS = ["breaking", "última hora", "urgente", "noticia", "anuncio"]
+
+# Compiled once; these run for every tweet parsed
+HASHTAG_PATTERN = re.compile(r'#(\w+)', re.IGNORECASE)
+SENTENCE_SPLIT_PATTERN = re.compile(r'[.!?]+')
+# URLs, mentions and hashtags are matched as "skip" tokens; words stop short of
+# an embedded URL so they split exactly where stripping the URL would
+TOKEN_PATTERN = re.compile(r'(?P<skip>http\S+|@\w+|#\w+)|(?P<word>(?:(?!http\S)\w)+)')
+
+# Spanish stop words ignored by keyword extraction
+STOP_WORDS = frozenset({'el', 'la', 'de', 'que', 'y', 'a', 'en', 'un', 'es', 'se', 'no', 'te', 'lo', 'le', 'da', 'su', 'por', 'son', 'con', 'para', 'al', 'del', 'los', 'las', 'una', 'como', 'pero', 'sus', 'me', 'hasta', 'hay', 'donde', 'han', 'quien', 'están', 'estado', 'desde', 'todo', 'nos', 'durante', 'todos', 'uno', 'les', 'ni', 'contra', 'otros', 'ese', 'eso', 'ante', 'ellos', 'e', 'esto', 'mí', 'antes', 'algunos', 'qué', 'unos', 'yo', 'otro', 'otras', 'otra', 'él', 'tanto', 'esa', 'estos', 'mucho', 'quienes', 'nada', 'muchos', 'cual', 'poco', 'ella', 'estar', 'estas', 'algunas', 'algo', 'nosotros'})
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ElNuevoDiaTweet:
-    """Represents a tweet from El Nuevo Día with parsed content."""
+    """Represents a tweet from El Nuevo Día with parsed content (immutable, no per-instance __dict__)."""
     tweet_id: str
     content: str
     created_at: datetime
@@ -34,7 +74,7 @@ class ElNuevoDiaTweet:
     def __post_init__(self):
         """Initialize default values after dataclass creation."""
         if self.topics is None:
-            self.topics = []
+            object.__setattr__(self, "topics", [])
 
 
 class ElNuevoDiaNewsAdapter(NewsProviderPort):
@@ -57,6 +97,8 @@ class ElNuevoDiaNewsAdapter(NewsProviderPort):
             "trending_topics": 600,  # 10 minutes for trending topics
             "user_info": 3600,  # 1 hour for user info
         }
+        # In-process cache in front of Redis for repeated calls from this process
+        self._local_cache = TTLCache(maxsize=LOCAL_CACHE_MAX_ENTRIES, ttl=LOCAL_CACHE_TTL_SECONDS)
         self.news_keywords = [
             # Breaking news indicators
             "BREAKING", "ÚLTIMA HORA", "URGENTE", "NOTICIA",
@@ -87,8 +129,37 @@ class ElNuevoDiaNewsAdapter(NewsProviderPort):
             "crime": ["crimen", "policía", "investigación", "arresto", "delito", "seguridad"]
         }
         
+        self._keyword_index = self._build_keyword_index()
+        
         logger.info("El Nuevo Día news adapter initialized")
     
+    def _build_keyword_index(self) -> Tuple[Tuple[str, FrozenSet[str]], ...]:
+        """
+        Merge every keyword list into one index of lowercased keyword -> match kinds.
+
+        Kinds are NEWS_MATCH, PR_MATCH, BREAKING_MATCH or a topic category name,
+        so a single pass over the index answers all per-tweet keyword questions.
+        """
+        index: Dict[str, Set[str]] = {}
+        for keyword in self.news_keywords:
+            index.setdefault(keyword.lower(), set()).add(NEWS_MATCH)
+        for category, keywords in self.topic_keywords.items():
+            for keyword in keywords:
+                index.setdefault(keyword, set()).add(category)
+        for keyword in PR_KEYWORDS:
+            index.setdefault(keyword, set()).add(PR_MATCH)
+        for keyword in BREAKING_KEYWORDS:
+            index.setdefault(keyword, set()).add(BREAKING_MATCH)
+        return tuple((keyword, frozenset(kinds)) for keyword, kinds in index.items())
+    
+    def _match_keywords(self, text_lower: str) -> Set[str]:
+        """Return the match kinds of every indexed keyword found in the lowercased text."""
+        matches: Set[str] = set()
+        for keyword, kinds in self._keyword_index:
+            if keyword in text_lower:
+                matches |= kinds
+        return matches
+    
     def _get_cache_key(self, key_type: str, **kwargs) -> str:
         """Generate cache key for different types of data."""
         base_key = f"elnuevodia:{key_type}"
@@ -99,20 +170,32 @@ class ElNuevoDiaNewsAdapter(NewsProviderPort):
             return f"{base_key}:{param_str}"
         return base_key
     
-    async def _get_cached_tweets(self, username: str, max_results: int, since_id: Optional[str] = None) -> Optional[List]:
+    async def _get_cached_payload(self, cache_key: str) -> Optional[Union[str, bytes]]:
+        """Get a serialized cache entry, checking the in-process cache before Redis."""
+        cached_data = self._local_cache.get(cache_key)
+        if cached_data is not None:
+            return cached_data
+        
+        # RedisClient returns None when Redis is unavailable, so no ping is needed
+        cached_data = await self.redis_client.get(cache_key)
+        if cached_data:
+            self._local_cache.set(cache_key, cached_data)
+        return cached_data
+    
+    async def _store_payload(self, cache_key: str, ttl: int, cache_data: bytes):
+        """Store a serialized cache entry in both the in-process cache and Redis."""
+        self._local_cache.set(cache_key, cache_data)
+        await self.redis_client.setex(cache_key, ttl, cache_data)
+    
+    async def _get_cached_tweets(self, username: str, max_results: int) -> Optional[List[TwitterSearchResult]]:
         """Get cached tweets if available."""
         try:
-            # Test Redis connection first
-            if not await self.redis_client.ping():
-                logger.warning("Redis not available, skipping cache")
-                return None
-                
-            cache_key = self._get_cache_key("tweets", username=username, max_results=max_results, since_id=since_id)
-            cached_data = await self.redis_client.get(cache_key)
+            cache_key = self._get_cache_key("tweets", username=username, max_results=max_results)
+            cached_data = await self._get_cached_payload(cache_key)
             
             if cached_data:
                 logger.info(f"Cache hit for tweets: {cache_key}")
-                return json.loads(cached_data)
+                return TWEETS_ADAPTER.validate_json(cached_data)
             
             logger.info(f"Cache miss for tweets: {cache_key}")
             return None
@@ -121,45 +204,31 @@ class ElNuevoDiaNewsAdapter(NewsProviderPort):
             logger.warning(f"Cache error when getting tweets: {str(e)}")
             return None
     
-    async def _cache_tweets(self, username: str, max_results: int, since_id: Optional[str] = None, tweets: Optional[List] = None):
+    async def _cache_tweets(self, username: str, max_results: int, tweets: Optional[List] = None):
         """Cache tweets with appropriate TTL."""
         try:
             if not tweets:
                 return
                 
-            # Test Redis connection first
-            if not await self.redis_client.ping():
-                logger.warning("Redis not available, skipping cache storage")
-                return
-                
-            cache_key = self._get_cache_key("tweets", username=username, max_results=max_results, since_id=since_id)
-            cache_data = json.dumps([tweet.__dict__ for tweet in tweets], default=str)
+            cache_key = self._get_cache_key("tweets", username=username, max_results=max_results)
+            cache_data = orjson.dumps([tweet.__dict__ for tweet in tweets], default=str)
             
-            await self.redis_client.setex(
-                cache_key, 
-                self.cache_ttl["tweets"], 
-                cache_data
-            )
+            await self._store_payload(cache_key, self.cache_ttl["tweets"], cache_data)
             
             logger.info(f"Cached {len(tweets)} tweets with key: {cache_key}")
             
         except Exception as e:
             logger.warning(f"Cache error when storing tweets: {str(e)}")
     
-    async def _get_cached_trending_topics(self, max_topics: int) -> Optional[List]:
+    async def _get_cached_trending_topics(self, max_topics: int) -> Optional[List[TrendingTopic]]:
         """Get cached trending topics if available."""
         try:
-            # Test Redis connection first
-            if not await self.redis_client.ping():
-                logger.warning("Redis not available, skipping cache")
-                return None
-                
             cache_key = self._get_cache_key("trending_topics", max_topics=max_topics)
-            cached_data = await self.redis_client.get(cache_key)
+            cached_data = await self._get_cached_payload(cache_key)
             
             if cached_data:
                 logger.info(f"Cache hit for trending topics: {cache_key}")
-                return json.loads(cached_data)
+                return TOPICS_ADAPTER.validate_json(cached_data)
             
             logger.info(f"Cache miss for trending topics: {cache_key}")
             return None
@@ -174,25 +243,39 @@ class ElNuevoDiaNewsAdapter(NewsProviderPort):
             if not topics:
                 return
                 
-            # Test Redis connection first
-            if not await self.redis_client.ping():
-                logger.warning("Redis not available, skipping cache storage")
-                return
-                
             cache_key = self._get_cache_key("trending_topics", max_topics=max_topics)
-            cache_data = json.dumps([topic.dict() for topic in topics], default=str)
+            cache_data = TOPICS_ADAPTER.dump_json(topics)
             
-            await self.redis_client.setex(
-                cache_key, 
-                self.cache_ttl["trending_topics"], 
-                cache_data
-            )
+            await self._store_payload(cache_key, self.cache_ttl["trending_topics"], cache_data)
             
             logger.info(f"Cached {len(topics)} trending topics with key: {cache_key}")
             
         except Exception as e:
             logger.warning(f"Cache error when storing trending topics: {str(e)}")
     
+    async def _get_recent_tweets(self, max_results: int) -> List[TwitterSearchResult]:
+        """
+        Get the latest @ElNuevoDia tweets, newest first, from cache or Twitter.
+        
+        Always fetches and caches at least RECENT_TWEETS_BATCH_SIZE tweets, so
+        news discovery and trending topics share one cache entry.
+        """
+        batch_size = max(max_results, RECENT_TWEETS_BATCH_SIZE)
+        tweets = await self._get_cached_tweets(username="ElNuevoDia", max_results=batch_size)
+        
+        if tweets:
+            logger.info("Using cached tweets")
+        else:
+            tweets = await self.twitter_connector.get_user_tweets(
+                username="ElNuevoDia",
+                max_results=batch_size
+            )
+            
+            # Cache the tweets for future use
+            await self._cache_tweets(username="ElNuevoDia", max_results=batch_size, tweets=tweets)
+        
+        return tweets[:max_results] if tweets else []
+    
     async def discover_latest_news(
         self,
         max_results: int = 10,
@@ -201,31 +284,16 @@ class ElNuevoDiaNewsAdapter(NewsProviderPort):
     ) -> List[NewsItem]:
         """Discover latest news from El Nuevo Día Twitter feed."""
         try:
-            # Try to get cached tweets first
-            cached_tweets = await self._get_cached_tweets(
-                username="ElNuevoDia",
-                max_results=max_results * 2,
-                since_id=self.last_processed_tweet_id
-            )
+            # Get recent tweets from @ElNuevoDia (more than needed, to filter).
+            # The cache holds the latest tweets regardless of since_id so that
+            # successive polls share one entry.
+            tweets = await self._get_recent_tweets(max_results * 2)
             
-            if cached_tweets:
-                logger.info("Using cached tweets for news discovery")
-                tweets = cached_tweets
-            else:
-                # Get recent tweets from @ElNuevoDia
-                tweets = await self.twitter_connector.get_user_tweets(
-                    username="ElNuevoDia",
-                    max_results=max_results * 2,  # Get more to filter
-                    since_id=self.last_processed_tweet_id
-                )
-                
-                # Cache the tweets for future use
-                await self._cache_tweets(
-                    username="ElNuevoDia",
-                    max_results=max_results * 2,
-                    since_id=self.last_processed_tweet_id,
-                    tweets=tweets
-                )
+            # Keep only tweets newer than the last processed one. Tweet ids are
+            # numeric strings, compared as numbers like the API's since_id
+            if tweets and self.last_processed_tweet_id:
+                last_processed_id = int(self.last_processed_tweet_id)
+                tweets = [tweet for tweet in tweets if int(tweet.tweet_id) > last_processed_id]
             
             if not tweets:
                 logger.info("No new tweets found from El Nuevo Día")
@@ -243,10 +311,11 @@ class ElNuevoDiaNewsAdapter(NewsProviderPort):
                     
                     news_item = self._convert_to_news_item(parsed_tweet)
                     news_items.append(news_item)
-                    
-                    # Update last processed tweet ID
-                    if not self.last_processed_tweet_id or tweet.tweet_id > self.last_processed_tweet_id:
-                        self.last_processed_tweet_id = tweet.tweet_id
+            
+            # Update last processed tweet ID once for the whole batch, news or not
+            newest_tweet_id = max(int(tweet.tweet_id) for tweet in tweets)
+            if not self.last_processed_tweet_id or newest_tweet_id > int(self.last_processed_tweet_id):
+                self.last_processed_tweet_id = str(newest_tweet_id)
             
             # Sort by relevance and limit results
             news_items.sort(key=lambda x: x.relevance_score, reverse=True)
@@ -267,36 +336,25 @@ class ElNuevoDiaNewsAdapter(NewsProviderPort):
             
             if cached_topics:
                 logger.info("Using cached trending topics")
-                # Convert back to TrendingTopic objects
-                return [TrendingTopic(**topic) for topic in cached_topics]
+                return cached_topics
             
             # Get recent tweets to analyze trending topics
-            tweets = await self.twitter_connector.get_user_tweets(
-                username="ElNuevoDia",
-                max_results=50
-            )
+            tweets = await self._get_recent_tweets(RECENT_TWEETS_BATCH_SIZE)
             
             if not tweets:
                 return []
             
-            # Extract hashtags and keywords
-            topic_counts = {}
+            # Count hashtags and keywords (already lowercased) across all tweets
+            topic_counts = Counter()
             for tweet in tweets:
-                # Extract hashtags
-                hashtags = re.findall(r'#(\w+)', tweet.content, re.IGNORECASE)
-                for hashtag in hashtags:
-                    hashtag_lower = hashtag.lower()
-                    topic_counts[hashtag_lower] = topic_counts.get(hashtag_lower, 0) + 1
-                
-                # Extract keywords from content
-                keywords = self._extract_keywords(tweet.content)
-                for keyword in keywords:
-                    keyword_lower = keyword.lower()
-                    topic_counts[keyword_lower] = topic_counts.get(keyword_lower, 0) + 1
+                topic_counts.update(chain(
+                    (hashtag.lower() for hashtag in HASHTAG_PATTERN.findall(tweet.content)),
+                    self._extract_keywords(tweet.content)
+                ))
             
-            # Convert to trending topics
+            # Convert the most mentioned terms to trending topics
             trending_topics = []
-            for term, count in sorted(topic_counts.items(), key=lambda x: x[1], reverse=True):
+            for term, count in heapq.nlargest(max_topics, topic_counts.items(), key=itemgetter(1)):
                 if count >= 2:  # Only include topics mentioned multiple times
                     relevance = min(count / 10.0, 1.0)  # Normalize relevance
                     category = self._categorize_topic(term)
@@ -309,9 +367,9 @@ class ElNuevoDiaNewsAdapter(NewsProviderPort):
                     ))
             
             # Cache the trending topics for future use
-            await self._cache_trending_topics(max_topics, trending_topics[:max_topics])
+            await self._cache_trending_topics(max_topics, trending_topics)
             
-            return trending_topics[:max_topics]
+            return trending_topics
             
         except Exception as e:
             logger.error(f"Error getting trending topics: {str(e)}")
@@ -342,7 +400,7 @@ class ElNuevoDiaNewsAdapter(NewsProviderPort):
             content=content,
             source=source,
             url=url,
-            published_at=published_at or datetime.now(timezone.utc),
+            published_at=published_at or datetime.now(UTC),
             topics=topics,
             relevance_score=relevance_score or 0.5
         )
@@ -352,24 +410,27 @@ class ElNuevoDiaNewsAdapter(NewsProviderPort):
         content = tweet.content
         content_lower = content.lower()
         
+        # Scan all keyword lists in a single pass
+        matches = self._match_keywords(content_lower)
+        
         # Check if this looks like a news tweet
-        is_news = any(keyword.lower() in content_lower for keyword in self.news_keywords)
+        is_news = NEWS_MATCH in matches
         
         # Extract headline (first sentence or first 100 characters)
         headline = None
         if is_news:
             # Try to extract a clean headline
-            sentences = re.split(r'[.!?]+', content)
+            sentences = SENTENCE_SPLIT_PATTERN.split(content)
             if sentences:
                 headline = sentences[0].strip()
                 if len(headline) > 100:
                     headline = headline[:97] + "..."
         
         # Extract topics
-        topics = self._extract_topics(content)
+        topics = self._extract_topics(content, matches)
         
         # Calculate relevance score
-        relevance_score = self._calculate_relevance_score(content, topics)
+        relevance_score = self._calculate_relevance_score(matches, topics)
         
         return ElNuevoDiaTweet(
             tweet_id=tweet.tweet_id,
@@ -382,50 +443,46 @@ class ElNuevoDiaNewsAdapter(NewsProviderPort):
             relevance_score=relevance_score
         )
     
-    def _extract_topics(self, content: str) -> List[str]:
+    def _extract_topics(self, content: str, matches: Set[str]) -> List[str]:
         """Extract topics from tweet content."""
-        content_lower = content.lower()
-        topics = []
-        
-        # Check each topic category
-        for topic, keywords in self.topic_keywords.items():
-            if any(keyword in content_lower for keyword in keywords):
-                topics.append(topic)
+        # Topic categories matched during the keyword scan
+        topics = [topic for topic in self.topic_keywords if topic in matches]
         
         # Extract hashtags as topics
-        hashtags = re.findall(r'#(\w+)', content, re.IGNORECASE)
-        topics.extend(hashtags)
+        topics.extend(HASHTAG_PATTERN.findall(content))
         
-        return list(set(topics))  # Remove duplicates
+        return list(dict.fromkeys(topics))  # Remove duplicates, keeping order
     
     def _extract_keywords(self, content: str) -> List[str]:
         """Extract important keywords from content."""
-        # Remove URLs, mentions, and hashtags
-        clean_content = re.sub(r'http\S+|@\w+|#\w+', '', content)
-        
-        # Split into words and filter
-        words = re.findall(r'\b\w+\b', clean_content.lower())
-        
-        # Filter out common words and short words
-        stop_words = {'el', 'la', 'de', 'que', 'y', 'a', 'en', 'un', 'es', 'se', 'no', 'te', 'lo', 'le', 'da', 'su', 'por', 'son', 'con', 'para', 'al', 'del', 'los', 'las', 'una', 'como', 'pero', 'sus', 'me', 'hasta', 'hay', 'donde', 'han', 'quien', 'están', 'estado', 'desde', 'todo', 'nos', 'durante', 'todos', 'uno', 'les', 'ni', 'contra', 'otros', 'ese', 'eso', 'ante', 'ellos', 'e', 'esto', 'mí', 'antes', 'algunos', 'qué', 'unos', 'yo', 'otro', 'otras', 'otra', 'él', 'tanto', 'esa', 'estos', 'mucho', 'quienes', 'nada', 'muchos', 'cual', 'poco', 'ella', 'estar', 'estas', 'algunas', 'algo', 'nosotros'}
-        
-        keywords = [word for word in words if len(word) > 3 and word not in stop_words]
+        keywords = []
+        # Single tokenizer pass, skipping URLs, mentions, and hashtags
+        for match in TOKEN_PATTERN.finditer(content):
+            word = match.group("word")
+            if word is None:
+                continue
+            
+            # Filter out common words and short words
+            word = word.lower()
+            if len(word) > 3 and word not in STOP_WORDS:
+                keywords.append(word)
+                if len(keywords) == 10:  # Limit to top 10 keywords
+                    break
         
-        return keywords[:10]  # Limit to top 10 keywords
+        return keywords
     
-    def _categorize_topic(self, term: str) -> str:
-        """Categorize a trending topic."""
-        term_lower = term.lower()
+    def _categorize_topic(self, term_lower: str) -> str:
+        """Categorize a trending topic (terms are already lowercased when counted)."""
+        matches = self._match_keywords(term_lower)
         
-        for category, keywords in self.topic_keywords.items():
-            if any(keyword in term_lower for keyword in keywords):
+        for category in self.topic_keywords:
+            if category in matches:
                 return category
         
         return "general"
     
-    def _calculate_relevance_score(self, content: str, topics: List[str]) -> float:
-        """Calculate relevance score for a news item."""
-        content_lower = content.lower()
+    def _calculate_relevance_score(self, matches: Set[str], topics: List[str]) -> float:
+        """Calculate relevance score for a news item from its keyword matches."""
         score = 0.0
         
         # Base score for having topics
@@ -433,13 +490,11 @@ class ElNuevoDiaNewsAdapter(NewsProviderPort):
             score += 0.3
         
         # Score for Puerto Rico relevance
-        pr_keywords = ["puerto rico", "puerto rican", "boricua", "san juan", "pr", "🇵🇷"]
-        if any(keyword in content_lower for keyword in pr_keywords):
+        if PR_MATCH in matches:
             score += 0.4
         
         # Score for breaking news indicators
-        breaking_keywords = ["breaking", "última hora", "urgente", "noticia", "anuncio"]
-        if any(keyword in content_lower for keyword in breaking_keywords):
+        if BREAKING_MATCH in matches:
             score += 0.3
         
         # Score for engagement (if available)
@@ -470,16 +525,18 @@ class ElNuevoDiaNewsAdapter(NewsProviderPort):
             True if successful, False otherwise
         """
         try:
+            self._local_cache.clear()
+            
             if cache_type:
                 # Clear specific cache type
                 pattern = f"elnuevodia:{cache_type}:*"
-                await self.redis_client.delete(pattern)
-                logger.info(f"Cleared cache for type: {cache_type}")
+                deleted = await self.redis_client.delete_pattern(pattern)
+                logger.info(f"Cleared {deleted} cache entries for type: {cache_type}")
             else:
                 # Clear all El Nuevo Día caches
                 pattern = "elnuevodia:*"
-                await self.redis_client.delete(pattern)
-                logger.info("Cleared all El Nuevo Día caches")
+                deleted = await self.redis_client.delete_pattern(pattern)
+                logger.info(f"Cleared all El Nuevo Día caches ({deleted} entries)")
             
             return True
             
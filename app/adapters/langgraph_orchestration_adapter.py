@@ -2,9 +2,16 @@
 LangGraph Orchestration Adapter - Clean interface to access the LangGraph layer.
 This is the key adapter that hides LangGraph complexity from external consumers.
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
+import asyncio
+import heapq
 import logging
+import time
+import uuid
+from collections import defaultdict, deque
 from datetime import datetime, timedelta, timezone
+from functools import cached_property
+from operator import attrgetter
 
 from app.ports.orchestration_service import (
     OrchestrationServicePort, OrchestrationRequest, OrchestrationResult,
@@ -19,9 +26,33 @@ from app.graphs.orchestrator import (
     add_news_item, get_available_characters
 )
 from app.ports.ai_provider import AIProviderPort
+from app.agents.base_character import BaseCharacterAgent
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CHARACTERS = ("jovani_vazquez",)
+
+# Health score: (api calls/hour threshold, penalty) checked highest first,
+# and how long without activity before the system counts as idle
+API_USAGE_PENALTIES = ((80, 0.2), (60, 0.1))
+INACTIVITY_THRESHOLD = timedelta(hours=1)
+
+# Reactions kept in the recent-reactions index (overall and per character)
+RECENT_REACTIONS_INDEX_SIZE = 1024
+
+# Shape shared by every force_character_interaction news item; each call
+# deep-copies it (the orchestrator appends to an item's lists in place) and
+# fills in only the per-call fields
+FORCED_INTERACTION_TOPICS = ("forced_interaction",)
+SYNTHETIC_NEWS_TEMPLATE = NewsItem(
+    id="forced_interaction",
+    headline="Direct Interaction Request",
+    content="",
+    source="system",
+    published_at=datetime(1970, 1, 1, tzinfo=timezone.utc),
+    topics=FORCED_INTERACTION_TOPICS
+)
+
 
 class LangGraphOrchestrationAdapter(OrchestrationServicePort):
     """
@@ -50,14 +81,34 @@ class LangGraphOrchestrationAdapter(OrchestrationServicePort):
             initial_characters: Characters to start with
         """
         self.ai_provider = ai_provider
+        
+        # Bounded indexes of reactions produced by our cycles, so recent-reaction
+        # queries never rescan the ever-growing state history
+        self._recent_reactions: deque = deque(maxlen=RECENT_REACTIONS_INDEX_SIZE)
+        self._recent_reactions_by_character: Dict[str, deque] = defaultdict(
+            lambda: deque(maxlen=RECENT_REACTIONS_INDEX_SIZE)
+        )
+        
+        # Characters paused through pause_character, checked before any cooldown math
+        self._paused_characters: Set[str] = set()
+        
+        # Serializes writers of orchestration state. A cycle holds it from start
+        # to finish, since execute_orchestration_cycle changes the state in place.
+        # Readers snapshot the state reference into a local and stay lock-free
+        self._state_lock = asyncio.Lock()
+        
         self.orchestration_state: Optional[OrchestrationState] = None
-        self.characters = get_available_characters()
-        self._initialize_state(initial_characters or ["jovani_vazquez"])
+        self._initialize_state(list(initial_characters or DEFAULT_CHARACTERS))
+    
+    @cached_property
+    def characters(self) -> Dict[str, BaseCharacterAgent]:
+        """Available character agents, built on first access rather than at construction."""
+        return get_available_characters()
     
     def _initialize_state(self, character_ids: List[str]):
         """Initialize the orchestration state."""
         self.orchestration_state = create_orchestration_state(character_ids)
-        logger.info(f"Initialized orchestration with characters: {character_ids}")
+        logger.info("Initialized orchestration with characters: %s", character_ids)
     
     async def process_content(self, request: OrchestrationRequest) -> OrchestrationResult:
         """
@@ -66,7 +117,7 @@ class LangGraphOrchestrationAdapter(OrchestrationServicePort):
         This is the main entry point - hides all LangGraph complexity!
         """
         try:
-            start_time = datetime.now(timezone.utc)
+            start_ns = time.monotonic_ns()
             
             # Handle different types of requests
             news_items = request.news_items or []
@@ -76,109 +127,135 @@ class LangGraphOrchestrationAdapter(OrchestrationServicePort):
                 # TODO: Filter characters based on request
                 pass
             
-            # Execute the LangGraph orchestration cycle
-            workflow_result = await execute_orchestration_cycle(
-                news_items=news_items,
-                existing_state=self.orchestration_state
-            )
-            
-            # Update our state
-            if workflow_result.get("orchestration_state"):
-                self.orchestration_state = workflow_result["orchestration_state"]
+            # Each orchestration cycle processes one queued news item, so several
+            # items get one cycle each. Cycles read and write the shared state
+            # (availability, cooldowns, the news queue), so they run one after
+            # another: a cooldown set by one cycle holds for the next item
+            if len(news_items) > 1:
+                workflow_results = [await self._run_cycle([news_item]) for news_item in news_items]
+            else:
+                workflow_results = [await self._run_cycle(news_items)]
             
             # Calculate execution time
-            end_time = datetime.now(timezone.utc)
-            execution_time_ms = int((end_time - start_time).total_seconds() * 1000)
+            execution_time_ms = (time.monotonic_ns() - start_ns) // 1_000_000
             
             # Convert LangGraph results to our clean interface
+            error_details = "; ".join(
+                result["error_details"] for result in workflow_results if result.get("error_details")
+            )
             return OrchestrationResult(
-                success=workflow_result.get("success", False),
+                success=all(result.get("success", False) for result in workflow_results),
                 execution_time_ms=execution_time_ms,
-                characters_processed=workflow_result.get("processing_characters", []),
-                reactions_generated=workflow_result.get("character_reactions", []),
-                conversations_created=workflow_result.get("new_conversations", []),
-                error_details=workflow_result.get("error_details"),
+                characters_processed=[
+                    character_id for result in workflow_results
+                    for character_id in result.get("processing_characters", [])
+                ],
+                reactions_generated=[
+                    reaction for result in workflow_results
+                    for reaction in result.get("character_reactions", [])
+                ],
+                conversations_created=[
+                    conversation for result in workflow_results
+                    for conversation in result.get("new_conversations", [])
+                ],
+                error_details=error_details or None,
                 performance_metrics={
-                    "workflow_step": workflow_result.get("workflow_step", "unknown"),
-                    "langgraph_execution_time": workflow_result.get("execution_time_ms", 0),
-                    "system_messages": workflow_result.get("system_messages", [])
+                    "workflow_step": workflow_results[-1].get("workflow_step", "unknown"),
+                    "langgraph_execution_time": sum(result.get("execution_time_ms", 0) for result in workflow_results),
+                    "system_messages": [
+                        message for result in workflow_results
+                        for message in result.get("system_messages", [])
+                    ],
+                    "cycles": len(workflow_results)
                 }
             )
             
         except Exception as e:
-            logger.error(f"Error in orchestration processing: {str(e)}")
-            return OrchestrationResult(
-                success=False,
-                execution_time_ms=0,
-                characters_processed=[],
-                reactions_generated=[],
-                conversations_created=[],
-                error_details=str(e),
-                performance_metrics={}
+            logger.error("Error in orchestration processing: %s", e)
+            return self._failed_result(str(e))
+    
+    async def _run_cycle(self, news_items: List[NewsItem]) -> Dict[str, Any]:
+        """Run one LangGraph orchestration cycle, holding the state lock throughout."""
+        async with self._state_lock:
+            workflow_result = await execute_orchestration_cycle(
+                news_items=news_items,
+                existing_state=self.orchestration_state
             )
+            
+            # Update our state and reaction indexes before releasing the lock
+            if workflow_result.get("orchestration_state"):
+                self.orchestration_state = workflow_result["orchestration_state"]
+            
+            for reaction in workflow_result.get("character_reactions", []):
+                self._recent_reactions.append(reaction)
+                self._recent_reactions_by_character[reaction.character_id].append(reaction)
+        
+        return workflow_result
     
     async def get_system_status(self) -> SystemStatus:
         """Get current system status - clean, simple interface."""
         try:
-            if not self.orchestration_state:
-                return SystemStatus(
-                    active=False,
-                    active_characters=[],
-                    pending_news_count=0,
-                    active_conversations_count=0,
-                    api_calls_this_hour=0,
-                    last_activity=datetime.now(timezone.utc),
-                    health_score=0.0
-                )
+            state = self.orchestration_state
+            if not state:
+                return self._inactive_status()
             
             # Get status from the orchestration state
-            status_data = await get_orchestration_status(self.orchestration_state)
+            status_data = await get_orchestration_status(state)
+            
+            # Read the datetime straight from the state instead of parsing
+            # the ISO string the status dict carries for external consumers
+            last_activity = state.last_activity
             
             # Calculate health score based on system metrics
-            health_score = self._calculate_health_score(status_data)
+            health_score = self._calculate_health_score(status_data, last_activity)
             
             return SystemStatus(
                 active=status_data.get("active", False),
-                active_characters=status_data.get("active_characters", []),
+                # status_data only carries the character count
+                active_characters=list(state.active_characters),
                 pending_news_count=status_data.get("pending_news", 0),
                 active_conversations_count=status_data.get("active_conversations", 0),
                 api_calls_this_hour=status_data.get("api_calls_this_hour", 0),
-                last_activity=datetime.fromisoformat(status_data.get("last_activity", datetime.now(timezone.utc).isoformat())),
+                last_activity=last_activity,
                 health_score=health_score
             )
             
         except Exception as e:
-            logger.error(f"Error getting system status: {str(e)}")
-            return SystemStatus(
-                active=False,
-                active_characters=[],
-                pending_news_count=0,
-                active_conversations_count=0,
-                api_calls_this_hour=0,
-                last_activity=datetime.now(timezone.utc),
-                health_score=0.0
-            )
+            logger.error("Error getting system status: %s", e)
+            return self._inactive_status()
     
-    async def get_character_status(self, character_id: str) -> Optional[CharacterStatus]:
-        """Get status of a specific character."""
+    async def get_character_status(
+        self,
+        character_id: str,
+        now: Optional[datetime] = None
+    ) -> Optional[CharacterStatus]:
+        """
+        Get status of a specific character.
+        
+        Args:
+            character_id: Character to look up
+            now: Current time, so a status sweep reads the clock once (defaults to now)
+        """
         try:
-            if not self.orchestration_state:
+            state = self.orchestration_state
+            if not state:
                 return None
             
-            agent_state = self.orchestration_state.character_states.get(character_id)
+            agent_state = state.character_states.get(character_id)
             if not agent_state:
                 return None
             
-            # Calculate cooldown seconds
+            # Calculate cooldown seconds; a paused character has no cooldown, just unavailability
+            paused = character_id in self._paused_characters
             cooldown_seconds = 0
-            if agent_state.cooldown_until:
-                remaining = agent_state.cooldown_until - datetime.now(timezone.utc)
+            if agent_state.cooldown_until and not paused:
+                remaining = agent_state.cooldown_until - (now or datetime.now(timezone.utc))
                 cooldown_seconds = max(0, int(remaining.total_seconds()))
             
             return CharacterStatus(
                 character_id=character_id,
                 character_name=agent_state.character_name,
-                available=is_character_available(agent_state),
+                available=not paused and is_character_available(agent_state),
                 last_interaction=agent_state.last_interaction_time,
                 interaction_count_today=agent_state.interaction_count,
                 current_cooldown_seconds=cooldown_seconds,
@@ -186,25 +263,27 @@ class LangGraphOrchestrationAdapter(OrchestrationServicePort):
             )
             
         except Exception as e:
-            logger.error(f"Error getting character status: {str(e)}")
+            logger.error("Error getting character status: %s", e)
             return None
     
     async def get_all_characters_status(self) -> List[CharacterStatus]:
         """Get status of all characters."""
         try:
-            if not self.orchestration_state:
+            state = self.orchestration_state
+            if not state:
                 return []
             
-            statuses = []
-            for character_id in self.orchestration_state.active_characters:
-                status = await self.get_character_status(character_id)
-                if status:
-                    statuses.append(status)
+            # Look characters up concurrently; get_character_status returns None on failure
+            now = datetime.now(timezone.utc)
+            statuses = await asyncio.gather(
+                *(self.get_character_status(character_id, now)
+                  for character_id in state.active_characters)
+            )
             
-            return statuses
+            return [status for status in statuses if status]
             
         except Exception as e:
-            logger.error(f"Error getting all character statuses: {str(e)}")
+            logger.error("Error getting all character statuses: %s", e)
             return []
     
     async def add_news_item(self, news_item: NewsItem) -> bool:
@@ -213,11 +292,12 @@ class LangGraphOrchestrationAdapter(OrchestrationServicePort):
             if not self.orchestration_state:
                 return False
             
-            await add_news_item(news_item, self.orchestration_state)
+            async with self._state_lock:
+                await add_news_item(news_item, self.orchestration_state)
             return True
             
         except Exception as e:
-            logger.error(f"Error adding news item: {str(e)}")
+            logger.error("Error adding news item: %s", e)
             return False
     
     async def force_character_interaction(
@@ -230,18 +310,18 @@ class LangGraphOrchestrationAdapter(OrchestrationServicePort):
         try:
             # Create a special orchestration request for this character
             if bypass_cooldown and self.orchestration_state:
-                agent_state = self.orchestration_state.character_states.get(character_id)
-                if agent_state:
-                    agent_state.cooldown_until = None
+                async with self._state_lock:
+                    agent_state = self.orchestration_state.character_states.get(character_id)
+                    if agent_state:
+                        self._paused_characters.discard(character_id)
+                        agent_state.cooldown_until = None
             
             # Create a synthetic news item for the interaction
-            synthetic_news = NewsItem(
-                headline="Direct Interaction Request",
-                content=context,
-                source="system",
-                published_at=datetime.now(timezone.utc),
-                topics=["forced_interaction"]
-            )
+            synthetic_news = SYNTHETIC_NEWS_TEMPLATE.model_copy(update={
+                "id": f"forced_{uuid.uuid4().hex}",
+                "content": context,
+                "published_at": datetime.now(timezone.utc)
+            }, deep=True)
             
             request = OrchestrationRequest(
                 news_items=[synthetic_news],
@@ -252,16 +332,8 @@ class LangGraphOrchestrationAdapter(OrchestrationServicePort):
             return await self.process_content(request)
             
         except Exception as e:
-            logger.error(f"Error forcing character interaction: {str(e)}")
-            return OrchestrationResult(
-                success=False,
-                execution_time_ms=0,
-                characters_processed=[],
-                reactions_generated=[],
-                conversations_created=[],
-                error_details=str(e),
-                performance_metrics={}
-            )
+            logger.error("Error forcing character interaction: %s", e)
+            return self._failed_result(str(e))
     
     async def pause_character(self, character_id: str) -> bool:
         """Pause a character from participating."""
@@ -269,16 +341,18 @@ class LangGraphOrchestrationAdapter(OrchestrationServicePort):
             if not self.orchestration_state:
                 return False
             
-            agent_state = self.orchestration_state.character_states.get(character_id)
-            if agent_state:
-                # Set a very long cooldown to effectively pause the character
-                agent_state.cooldown_until = datetime.now(timezone.utc) + timedelta(days=365)
-                return True
+            async with self._state_lock:
+                agent_state = self.orchestration_state.character_states.get(character_id)
+                if agent_state:
+                    self._paused_characters.add(character_id)
+                    # The orchestrator only checks cooldowns, so keep it from selecting the character
+                    agent_state.cooldown_until = datetime.now(timezone.utc) + timedelta(days=365)
+                    return True
             
             return False
             
         except Exception as e:
-            logger.error(f"Error pausing character: {str(e)}")
+            logger.error("Error pausing character: %s", e)
             return False
     
     async def resume_character(self, character_id: str) -> bool:
@@ -287,27 +361,30 @@ class LangGraphOrchestrationAdapter(OrchestrationServicePort):
             if not self.orchestration_state:
                 return False
             
-            agent_state = self.orchestration_state.character_states.get(character_id)
-            if agent_state:
-                agent_state.cooldown_until = None
-                return True
+            async with self._state_lock:
+                agent_state = self.orchestration_state.character_states.get(character_id)
+                if agent_state:
+                    self._paused_characters.discard(character_id)
+                    agent_state.cooldown_until = None
+                    return True
             
             return False
             
         except Exception as e:
-            logger.error(f"Error resuming character: {str(e)}")
+            logger.error("Error resuming character: %s", e)
             return False
     
     async def get_active_conversations(self) -> List[ConversationThread]:
         """Get all active conversation threads."""
         try:
-            if not self.orchestration_state:
+            state = self.orchestration_state
+            if not state:
                 return []
             
-            return self.orchestration_state.active_conversations
+            return state.active_conversations
             
         except Exception as e:
-            logger.error(f"Error getting active conversations: {str(e)}")
+            logger.error("Error getting active conversations: %s", e)
             return []
     
     async def get_recent_reactions(
@@ -320,18 +397,17 @@ class LangGraphOrchestrationAdapter(OrchestrationServicePort):
             if not self.orchestration_state:
                 return []
             
-            reactions = self.orchestration_state.character_reactions
-            
-            # Filter by character if specified
+            # Use the per-character index if a character is specified
             if character_id:
-                reactions = [r for r in reactions if r.character_id == character_id]
+                reactions = self._recent_reactions_by_character.get(character_id, ())
+            else:
+                reactions = self._recent_reactions
             
-            # Sort by timestamp and limit
-            reactions.sort(key=lambda r: r.generated_at, reverse=True)
-            return reactions[:limit]
+            # Newest first, limited; the index is bounded so this never scans full history
+            return heapq.nlargest(limit, reactions, key=attrgetter("generated_at"))
             
         except Exception as e:
-            logger.error(f"Error getting recent reactions: {str(e)}")
+            logger.error("Error getting recent reactions: %s", e)
             return []
     
     async def health_check(self) -> bool:
@@ -346,7 +422,7 @@ class LangGraphOrchestrationAdapter(OrchestrationServicePort):
             return ai_healthy and state_healthy
             
         except Exception as e:
-            logger.error(f"Health check failed: {str(e)}")
+            logger.error("Health check failed: %s", e)
             return False
     
     async def shutdown_gracefully(self) -> bool:
@@ -359,10 +435,41 @@ class LangGraphOrchestrationAdapter(OrchestrationServicePort):
             return True
             
         except Exception as e:
-            logger.error(f"Error during shutdown: {str(e)}")
+            logger.error("Error during shutdown: %s", e)
             return False
     
-    def _calculate_health_score(self, status_data: Dict[str, Any]) -> float:
+    @staticmethod
+    def _failed_result(error_details: str) -> OrchestrationResult:
+        """Build the result returned when orchestration processing fails."""
+        return OrchestrationResult(
+            success=False,
+            execution_time_ms=0,
+            characters_processed=[],
+            reactions_generated=[],
+            conversations_created=[],
+            error_details=error_details,
+            performance_metrics={}
+        )
+    
+    @staticmethod
+    def _inactive_status() -> SystemStatus:
+        """Build the status reported when there is no usable orchestration state."""
+        return SystemStatus(
+            active=False,
+            active_characters=[],
+            pending_news_count=0,
+            active_conversations_count=0,
+            api_calls_this_hour=0,
+            last_activity=datetime.now(timezone.utc),
+            health_score=0.0
+        )
+    
+    def _calculate_health_score(
+        self,
+        status_data: Dict[str, Any],
+        last_activity: Optional[datetime],
+        now: Optional[datetime] = None
+    ) -> float:
         """Calculate system health score from 0.0 to 1.0."""
         try:
             score = 1.0
@@ -371,19 +478,17 @@ class LangGraphOrchestrationAdapter(OrchestrationServicePort):
             if not status_data.get("active", False):
                 score -= 0.5
             
-            # Penalize high API usage
+            # Penalize high API usage (first matching threshold wins)
             api_calls = status_data.get("api_calls_this_hour", 0)
-            if api_calls > 80:
-                score -= 0.2
-            elif api_calls > 60:
-                score -= 0.1
+            score -= next(
+                (penalty for threshold, penalty in API_USAGE_PENALTIES if api_calls > threshold),
+                0.0
+            )
             
             # Penalize if no recent activity
-            last_activity_str = status_data.get("last_activity")
-            if last_activity_str:
-                last_activity = datetime.fromisoformat(last_activity_str)
-                time_since_activity = datetime.now(timezone.utc) - last_activity
-                if time_since_activity > timedelta(hours=1):
+            if last_activity:
+                time_since_activity = (now or datetime.now(timezone.utc)) - last_activity
+                if time_since_activity > INACTIVITY_THRESHOLD:
                     score -= 0.2
             
             return max(0.0, min(1.0, score))
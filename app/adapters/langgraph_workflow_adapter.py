@@ -3,21 +3,54 @@ LangGraph workflow adapter that implements WorkflowExecutorPort.
 Handles proper compilation and execution of LangGraph workflows.
 """
 import logging
-from typing import Any, Dict, Optional
-from datetime import datetime, timezone
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
 from app.ports.workflow_executor import WorkflowExecutorPort, WorkflowExecutionResult
 
 logger = logging.getLogger(__name__)
 
+# Resolved once at import; health checks are polled and only need the answer
+try:
+    import langgraph
+    from langgraph.graph import StateGraph  # noqa: F401
+    LANGGRAPH_AVAILABLE = True
+    LANGGRAPH_VERSION = getattr(langgraph, '__version__', 'unknown')
+except ImportError:
+    LANGGRAPH_AVAILABLE = False
+    LANGGRAPH_VERSION = 'not_installed'
+
+# Compiled graphs kept at once. The app's definitions come from lru_cached
+# builders and live for the whole process; the limit only bounds ad-hoc ones
+COMPILED_WORKFLOW_CACHE_SIZE = 8
+
 
 class LangGraphWorkflowAdapter(WorkflowExecutorPort):
     """Adapter for executing LangGraph workflows with proper compilation."""
     
+    # Compiled graphs shared by every adapter instance, keyed by id() of the
+    # workflow definition, least recently used evicted first. Each entry holds
+    # its definition too, so that id cannot be reused while the entry exists
+    _compiled_workflows: "OrderedDict[int, Tuple[Any, Any]]" = OrderedDict()
+    
     def __init__(self):
         """Initialize the LangGraph workflow adapter."""
         self.executor_type = "langgraph"
-        self.version = self._get_langgraph_version()
+        self.version = LANGGRAPH_VERSION
+        
+        # Static part of the result metadata, built once; each result gets its own copy
+        self._success_metadata = {
+            "executor_type": self.executor_type,
+            "version": self.version,
+            "compilation_successful": True,
+            "execution_method": "ainvoke"
+        }
+        self._failure_metadata = {
+            "executor_type": self.executor_type,
+            "version": self.version,
+            "compilation_successful": False
+        }
     
     async def execute_workflow(
         self,
@@ -31,48 +64,40 @@ class LangGraphWorkflowAdapter(WorkflowExecutorPort):
         Args:
             workflow_definition: StateGraph workflow definition
             initial_state: Initial state for the workflow
-            config: Optional configuration (unused for LangGraph)
+            config: Optional configuration (unused for LangGraph, kept for the port signature)
             
         Returns:
             WorkflowExecutionResult: Result of the workflow execution
         """
-        start_time = datetime.now(timezone.utc)
+        start_ns = time.monotonic_ns()
         
         try:
-            # Compile the workflow
-            logger.debug("Compiling LangGraph workflow")
-            compiled_workflow = workflow_definition.compile()
+            # Compile the workflow (cached per definition)
+            compiled_workflow = self._get_compiled_workflow(workflow_definition)
             
             # Execute the workflow
             logger.debug("Executing compiled workflow")
             final_state = await compiled_workflow.ainvoke(initial_state)
             
             # Calculate execution time
-            end_time = datetime.now(timezone.utc)
-            execution_time_ms = int((end_time - start_time).total_seconds() * 1000)
+            execution_time_ms = (time.monotonic_ns() - start_ns) // 1_000_000
             
             # Create result
             result = WorkflowExecutionResult(
                 success=True,
                 final_state=final_state,
                 execution_time_ms=execution_time_ms,
-                metadata={
-                    "executor_type": self.executor_type,
-                    "version": self.version,
-                    "compilation_successful": True,
-                    "execution_method": "ainvoke"
-                }
+                metadata=self._success_metadata.copy()
             )
             
-            logger.info(f"Workflow executed successfully in {execution_time_ms}ms")
+            logger.info("Workflow executed successfully in %dms", execution_time_ms)
             return result
             
         except Exception as e:
             # Calculate execution time even for failures
-            end_time = datetime.now(timezone.utc)
-            execution_time_ms = int((end_time - start_time).total_seconds() * 1000)
+            execution_time_ms = (time.monotonic_ns() - start_ns) // 1_000_000
             
-            logger.error(f"Workflow execution failed: {str(e)}")
+            logger.error("Workflow execution failed: %s", e)
             
             # Return error result
             return WorkflowExecutionResult(
@@ -80,14 +105,27 @@ class LangGraphWorkflowAdapter(WorkflowExecutorPort):
                 final_state=initial_state,
                 execution_time_ms=execution_time_ms,
                 error_details=str(e),
-                metadata={
-                    "executor_type": self.executor_type,
-                    "version": self.version,
-                    "compilation_successful": False,
-                    "error_type": type(e).__name__
-                }
+                metadata={**self._failure_metadata, "error_type": type(e).__name__}
             )
     
+    def _get_compiled_workflow(self, workflow_definition: Any) -> Any:
+        """Return the compiled graph for a workflow definition, compiling it on first use."""
+        key = id(workflow_definition)
+        entry = self._compiled_workflows.get(key)
+        if entry is not None:
+            self._compiled_workflows.move_to_end(key)
+            return entry[1]
+        
+        # compile() is synchronous, so concurrent callers on the event loop
+        # cannot interleave here and compile the same definition twice
+        logger.debug("Compiling LangGraph workflow")
+        compiled_workflow = workflow_definition.compile()
+        self._compiled_workflows[key] = (workflow_definition, compiled_workflow)
+        if len(self._compiled_workflows) > COMPILED_WORKFLOW_CACHE_SIZE:
+            self._compiled_workflows.popitem(last=False)
+        
+        return compiled_workflow
+    
     async def health_check(self) -> bool:
         """
         Check if LangGraph is available and healthy.
@@ -95,12 +133,9 @@ class LangGraphWorkflowAdapter(WorkflowExecutorPort):
         Returns:
             bool: True if LangGraph is available
         """
-        try:
-            from langgraph.graph import StateGraph
-            return True
-        except ImportError:
+        if not LANGGRAPH_AVAILABLE:
             logger.warning("LangGraph not available")
-            return False
+        return LANGGRAPH_AVAILABLE
     
     def get_executor_info(self) -> Dict[str, Any]:
         """
@@ -121,11 +156,3 @@ class LangGraphWorkflowAdapter(WorkflowExecutorPort):
             "supported_workflow_types": ["StateGraph"],
             "execution_methods": ["ainvoke"]
         }
-    
-    def _get_langgraph_version(self) -> str:
-        """Get the LangGraph version."""
-        try:
-            import langgraph
-            return getattr(langgraph, '__version__', 'unknown')
-        except ImportError:
-            return 'not_installed' 
\ No newline at end of file
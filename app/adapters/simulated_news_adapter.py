@@ -2,15 +2,54 @@
 Simulated News Adapter - Implements NewsProviderPort for demos and testing.
 This adapter provides pre-configured news scenarios for demonstrations.
 """
-from typing import List, Dict, Any, Optional
-import json
+from typing import List, Dict, Any, Optional, Iterable
+import heapq
 import logging
+import re
+from collections import Counter, defaultdict, deque
 from datetime import datetime, timezone
-import random
+from itertools import chain, count
+from operator import attrgetter
 
 from app.ports.news_provider import NewsProviderPort, TrendingTopic, NewsProviderInfo
 from app.models.conversation import NewsItem
 
+# Ingested items kept for discovery unless the config sets "max_ingested";
+# the oldest are dropped first
+DEFAULT_MAX_INGESTED_NEWS = 1000
+
+# News ranking (relevance, then recency) and how many top items trending topics sample
+NEWS_RANK_KEY = attrgetter("relevance_score", "published_at")
+TRENDING_NEWS_SAMPLE_SIZE = 50
+
+# Relevance added per keyword found in the content, as one flat table
+# so scoring is a single pass instead of one loop per keyword group
+PR_KEYWORDS = ("puerto rico", "boricua", "borinquen", "san juan", "ponce", "mayaguez")
+NEWS_KEYWORDS = ("breaking", "noticia", "anuncio", "gobierno", "política", "economía")
+RELEVANCE_KEYWORD_WEIGHTS = (
+    tuple((keyword, 0.2) for keyword in PR_KEYWORDS)
+    + tuple((keyword, 0.1) for keyword in NEWS_KEYWORDS)
+)
+CATEGORY_SCORE_BONUS = {"politics": 0.2, "entertainment": 0.15, "culture": 0.15}
+
+# Content-based category detection, checked in order (first category with a hit wins)
+CATEGORY_KEYWORDS = (
+    ("politics", ("política", "gobierno", "senado", "cámara")),
+    ("entertainment", ("música", "concierto", "artista", "entretenimiento")),
+    ("culture", ("cultura", "turismo", "museo")),
+)
+# Flattened keyword -> category index, in the same precedence order, so
+# detection is one loop with no per-category generator
+CATEGORY_BY_KEYWORD: Dict[str, str] = {
+    keyword: category for category, keywords in CATEGORY_KEYWORDS for keyword in keywords
+}
+
+# Key term extraction: words of 4+ characters starting with a letter, with inner
+# apostrophes and hyphens kept so "pa'lante" and "covid-19" stay whole, minus
+# common words
+KEY_TERM_PATTERN = re.compile(r"[^\W\d_]\w*(?:['’-]\w+)*")
+KEY_TERM_MIN_LENGTH = 4
+STOP_WORDS = frozenset({"the", "and", "for", "are", "but", "not", "you", "all", "can", "had", "her", "was", "one", "our", "out", "day", "get", "has", "him", "his", "how", "man", "new", "now", "old", "see", "two", "way", "who", "boy", "did", "its", "let", "put", "say", "she", "too", "use"})
 
 class SimulatedNewsAdapter(NewsProviderPort):
     """
@@ -26,8 +65,20 @@ class SimulatedNewsAdapter(NewsProviderPort):
     def __init__(self, demo_scenarios_config: Dict[str, Any]):
         self.demo_scenarios = demo_scenarios_config.get("scenarios", [])
         self.current_scenario_index = 0
-        self.ingested_news = []
+        self.ingested_news: deque = deque(
+            maxlen=int(demo_scenarios_config.get("max_ingested", DEFAULT_MAX_INGESTED_NEWS))
+        )
+        # Content category per news item id, detected once when the item is created
+        self._item_categories: Dict[str, str] = {}
         self.logger = logging.getLogger(__name__)
+        # Fallback ids for scenarios without one; unique for this adapter
+        self._scenario_ids = count(1)
+        
+        # Scenarios never change once added, so convert them to news items once
+        self._scenario_items: List[NewsItem] = [
+            news_item for news_item in map(self._scenario_to_news_item, self.demo_scenarios)
+            if news_item
+        ]
 
     async def discover_latest_news(
         self,
@@ -47,31 +98,18 @@ class SimulatedNewsAdapter(NewsProviderPort):
             List of NewsItem objects
         """
         try:
-            self.logger.info(f"Discovering latest news from {len(self.demo_scenarios)} demo scenarios")
+            self.logger.info("Discovering latest news from %d demo scenarios", len(self.demo_scenarios))
             
-            # Combine demo scenarios with ingested news
-            all_news = []
+            # Filter demo scenarios and ingested news by categories and relevance
+            filtered_news = self._filter_news(self._all_news(), categories, min_relevance_score)
             
-            # Add demo scenarios
-            for scenario in self.demo_scenarios:
-                news_item = self._scenario_to_news_item(scenario)
-                if news_item:
-                    all_news.append(news_item)
+            self.logger.info("Discovered %d filtered news items", len(filtered_news))
             
-            # Add ingested news
-            all_news.extend(self.ingested_news)
-            
-            # Filter by categories and relevance
-            filtered_news = self._filter_news(all_news, categories, min_relevance_score)
-            
-            # Sort by relevance and recency
-            filtered_news.sort(key=lambda x: (x.relevance_score, x.published_at), reverse=True)
-            
-            self.logger.info(f"Discovered {len(filtered_news)} filtered news items")
-            return filtered_news[:max_results]
+            # Top items by relevance and recency, without sorting the whole list
+            return heapq.nlargest(max_results, filtered_news, key=NEWS_RANK_KEY)
             
         except Exception as e:
-            self.logger.error(f"Error discovering news: {str(e)}")
+            self.logger.error("Error discovering news: %s", e)
             return []
 
     async def get_trending_topics(self, max_topics: int = 10) -> List[TrendingTopic]:
@@ -85,16 +123,17 @@ class SimulatedNewsAdapter(NewsProviderPort):
             List of TrendingTopic objects
         """
         try:
-            # Get all news items
-            news_items = await self.discover_latest_news(max_results=50)
+            # Sample the most relevant news items directly, skipping the
+            # discovery wrapper and its logging
+            news_items = heapq.nlargest(
+                TRENDING_NEWS_SAMPLE_SIZE, self._filter_news(self._all_news()), key=NEWS_RANK_KEY
+            )
             
             # Extract trending topics
-            trending_topics = self._extract_trending_topics(news_items)
-            
-            return trending_topics[:max_topics]
+            return self._extract_trending_topics(news_items, max_topics)
             
         except Exception as e:
-            self.logger.error(f"Error getting trending topics: {str(e)}")
+            self.logger.error("Error getting trending topics: %s", e)
             return []
 
     async def ingest_news_item(
@@ -130,24 +169,29 @@ class SimulatedNewsAdapter(NewsProviderPort):
                 relevance_score = self._calculate_relevance_score(content, category)
             
             # Create news item
+            content_lower = content.lower()
+            now = datetime.now(timezone.utc)
             news_item = NewsItem(
-                id=f"ingested_{datetime.now(timezone.utc).timestamp()}",
+                id=f"ingested_{now.timestamp()}",
                 headline=headline,
                 content=content,
                 source=source,
                 url=url,
-                published_at=published_at.isoformat() if published_at else datetime.now(timezone.utc).isoformat(),
+                published_at=(published_at or now).isoformat(),
                 relevance_score=relevance_score
             )
             
-            # Add to ingested news
+            # Add to ingested news, forgetting the category of any item it evicts
+            if self.ingested_news and len(self.ingested_news) == self.ingested_news.maxlen:
+                self._item_categories.pop(self.ingested_news[0].id, None)
             self.ingested_news.append(news_item)
+            self._item_categories[news_item.id] = self._detect_category(content_lower)
             
-            self.logger.info(f"Ingested news item: {headline}")
+            self.logger.info("Ingested news item: %s", headline)
             return news_item
             
         except Exception as e:
-            self.logger.error(f"Error ingesting news item: {str(e)}")
+            self.logger.error("Error ingesting news item: %s", e)
             raise
 
     async def health_check(self) -> bool:
@@ -162,7 +206,7 @@ class SimulatedNewsAdapter(NewsProviderPort):
             return True
             
         except Exception as e:
-            self.logger.error(f"Health check failed: {str(e)}")
+            self.logger.error("Health check failed: %s", e)
             return False
 
     async def get_provider_info(self) -> NewsProviderInfo:
@@ -193,8 +237,8 @@ class SimulatedNewsAdapter(NewsProviderPort):
     def _scenario_to_news_item(self, scenario: Dict[str, Any]) -> Optional[NewsItem]:
         """Convert a demo scenario to a NewsItem."""
         try:
-            return NewsItem(
-                id=scenario.get("id", f"scenario_{random.randint(1000, 9999)}"),
+            news_item = NewsItem(
+                id=scenario.get("id") or f"scenario_{next(self._scenario_ids)}",
                 headline=scenario["headline"],
                 content=scenario["content"],
                 source=scenario["source"],
@@ -202,8 +246,10 @@ class SimulatedNewsAdapter(NewsProviderPort):
                 published_at=scenario.get("published_at", datetime.now(timezone.utc).isoformat()),
                 relevance_score=scenario.get("relevance_score", 0.8)
             )
+            self._item_categories[news_item.id] = self._detect_category(news_item.content.lower())
+            return news_item
         except Exception as e:
-            self.logger.error(f"Error converting scenario to news item: {str(e)}")
+            self.logger.error("Error converting scenario to news item: %s", e)
             return None
 
     def _calculate_relevance_score(self, content: str, category: Optional[str]) -> float:
@@ -213,123 +259,120 @@ class SimulatedNewsAdapter(NewsProviderPort):
         
         content_lower = content.lower()
         
-        # Add score for Puerto Rican keywords
-        pr_keywords = ["puerto rico", "boricua", "borinquen", "san juan", "ponce", "mayaguez"]
-        for keyword in pr_keywords:
-            if keyword in content_lower:
-                score += 0.2
-        
-        # Add score for news keywords
-        news_keywords = ["breaking", "noticia", "anuncio", "gobierno", "política", "economía"]
-        for keyword in news_keywords:
+        # Add score for Puerto Rican and news keywords
+        for keyword, weight in RELEVANCE_KEYWORD_WEIGHTS:
             if keyword in content_lower:
-                score += 0.1
+                score += weight
         
         # Add score for category
         if category:
-            if category == "politics":
-                score += 0.2
-            elif category == "entertainment":
-                score += 0.15
-            elif category == "culture":
-                score += 0.15
+            score += CATEGORY_SCORE_BONUS.get(category, 0.0)
         
         # Cap at 1.0
         return min(score, 1.0)
 
+    def _all_news(self) -> Iterable[NewsItem]:
+        """Demo scenario items followed by ingested news, without copying either."""
+        return chain(self._scenario_items, self.ingested_news)
+
     def _filter_news(
         self,
-        news_items: List[NewsItem],
+        news_items: Iterable[NewsItem],
         categories: Optional[List[str]] = None,
         min_relevance_score: float = 0.3
     ) -> List[NewsItem]:
         """Filter news items by categories and relevance score."""
         filtered = []
+        categories_set = set(categories) if categories else None
         
         for item in news_items:
             # Check relevance score
             if item.relevance_score < min_relevance_score:
                 continue
             
-            # Check categories if specified
-            if categories:
-                # Simple category detection based on content
-                content_lower = item.content.lower()
-                item_category = "general"
-                
-                if any(keyword in content_lower for keyword in ["política", "gobierno", "senado", "cámara"]):
-                    item_category = "politics"
-                elif any(keyword in content_lower for keyword in ["música", "concierto", "artista", "entretenimiento"]):
-                    item_category = "entertainment"
-                elif any(keyword in content_lower for keyword in ["cultura", "turismo", "museo"]):
-                    item_category = "culture"
-                
-                if item_category not in categories:
-                    continue
+            # Check categories if specified, using the category detected at creation
+            if categories_set and self._get_item_category(item) not in categories_set:
+                continue
             
             filtered.append(item)
         
         return filtered
 
-    def _extract_trending_topics(self, news_items: List[NewsItem]) -> List[TrendingTopic]:
-        """Extract trending topics from news items."""
-        topic_counts = {}
+    def _detect_category(self, content_lower: str) -> str:
+        """Simple category detection based on lowercased content."""
+        for keyword, category in CATEGORY_BY_KEYWORD.items():
+            if keyword in content_lower:
+                return category
+        return "general"
+
+    def _get_item_category(self, item: NewsItem) -> str:
+        """Get the cached content category of a news item, detecting it if unknown."""
+        category = self._item_categories.get(item.id)
+        if category is None:
+            category = self._detect_category(item.content.lower())
+        return category
+
+    def _extract_trending_topics(self, news_items: List[NewsItem], max_topics: int) -> List[TrendingTopic]:
+        """Extract the top trending topics from news items."""
+        topic_counts: Counter = Counter()
+        relevance_sums: Dict[str, float] = defaultdict(float)
         
         for item in news_items:
             # Extract key terms from content
             terms = self._extract_key_terms(item.content)
+            topic_counts.update(terms)
             
+            relevance = item.relevance_score
             for term in terms:
-                if term not in topic_counts:
-                    topic_counts[term] = {
-                        "count": 0,
-                        "relevance": 0.0,
-                        "category": "general"
-                    }
-                
-                topic_counts[term]["count"] += 1
-                topic_counts[term]["relevance"] += item.relevance_score
-        
-        # Convert to TrendingTopic objects
-        trending_topics = []
-        for term, data in topic_counts.items():
-            if data["count"] >= 1:  # Include all terms for demo
-                topic = TrendingTopic(
-                    term=term,
-                    count=data["count"],
-                    relevance=data["relevance"] / data["count"],  # Average relevance
-                    category=data["category"]
-                )
-                trending_topics.append(topic)
+                relevance_sums[term] += relevance
         
-        # Sort by count and relevance
-        trending_topics.sort(key=lambda x: (x.count, x.relevance), reverse=True)
+        # Average relevance per term (every counted term is a candidate for demo)
+        average_relevance = {
+            term: relevance_sums[term] / count for term, count in topic_counts.items()
+        }
         
-        return trending_topics
+        # Pick the top terms by count and relevance, then build TrendingTopic
+        # objects only for those
+        top_terms = heapq.nlargest(
+            max_topics, topic_counts, key=lambda term: (topic_counts[term], average_relevance[term])
+        )
+        return [
+            TrendingTopic(
+                term=term,
+                count=topic_counts[term],
+                relevance=average_relevance[term],
+                category="general"
+            )
+            for term in top_terms
+        ]
 
     def _extract_key_terms(self, content: str) -> List[str]:
         """Extract key terms from content."""
-        # Simple term extraction - split by spaces and filter
-        words = content.lower().split()
+        # Simple term extraction - one regex pass tokenizes, drops short words
+        # and punctuation; stop the scan once we have enough terms
         terms = []
         
-        for word in words:
-            # Remove common words and short words
-            if len(word) > 3 and word not in ["the", "and", "for", "are", "but", "not", "you", "all", "can", "had", "her", "was", "one", "our", "out", "day", "get", "has", "him", "his", "how", "man", "new", "now", "old", "see", "two", "way", "who", "boy", "did", "its", "let", "put", "say", "she", "too", "use"]:
-                # Remove punctuation
-                word = word.strip(".,!?;:()[]{}'\"")
-                if word:
-                    terms.append(word)
+        for match in KEY_TERM_PATTERN.finditer(content.lower()):
+            word = match.group()
+            if len(word) >= KEY_TERM_MIN_LENGTH and word not in STOP_WORDS:
+                terms.append(word)
+                if len(terms) == 10:  # Limit to top 10 terms
+                    break
         
-        return terms[:10]  # Limit to top 10 terms
+        return terms
 
     def add_demo_scenario(self, scenario: Dict[str, Any]):
         """Add a new demo scenario."""
         self.demo_scenarios.append(scenario)
-        self.logger.info(f"Added demo scenario: {scenario.get('headline', 'Unknown')}")
+        news_item = self._scenario_to_news_item(scenario)
+        if news_item:
+            self._scenario_items.append(news_item)
+        self.logger.info("Added demo scenario: %s", scenario.get('headline', 'Unknown'))
 
     def clear_ingested_news(self):
         """Clear all ingested news items."""
+        for news_item in self.ingested_news:
+            self._item_categories.pop(news_item.id, None)
         self.ingested_news.clear()
         self.logger.info("Cleared all ingested news items")
 
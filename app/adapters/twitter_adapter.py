@@ -2,8 +2,10 @@
 Twitter Adapter - Implements TwitterProviderPort using TwitterConnector.
 This is the "adapter" that connects our port to the external Twitter service.
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, FrozenSet
 import logging
+import re
+from operator import attrgetter
 
 from app.ports.twitter_provider import (
     TwitterProviderPort, TwitterPost, TwitterPostResult, TwitterSearchResult,
@@ -13,6 +15,39 @@ from app.tools.twitter_connector import TwitterConnector
 
 logger = logging.getLogger(__name__)
 
+# Any non-ASCII code point; counted as a rough emoji measure
+NON_ASCII_PATTERN = re.compile(r"[^\x00-\x7f]")
+
+# Puerto Rico indicators, one case-insensitive pass each; "pr" must be a whole
+# word so queries like "price" or "april" don't count as already PR-specific
+PR_QUERY_PATTERN = re.compile(r"puerto rico|boricua|\bpr\b|🇵🇷", re.IGNORECASE)
+PR_CONTEXT_PATTERN = re.compile(r"puerto rico|boricua|\bpr\b|🇵🇷|san juan|coquí", re.IGNORECASE)
+
+# Per-character tweet decorations; hashtags are stored pre-joined since they
+# are only ever used as tweet text
+CHARACTER_HASHTAGS: Dict[str, str] = {
+    "jovani_vazquez": "#JovaniVazquez #PRInfluencer #BoricuaVibes",
+    "politico_boricua": "#PoliticoBoricua #PRPolitics #PuertoRico",
+    "ciudadano_boricua": "#CiudadanoBoricua #VidaBoricua #PRDaily",
+    "historiador_cultural": "#HistoriaPR #CulturaBoricua #PatrimonioPR"
+}
+DEFAULT_CHARACTER_HASHTAGS = "#PuertoRico"
+
+CHARACTER_SIGNATURES: Dict[str, str] = {
+    "jovani_vazquez": "🔥 Jovani",
+    "politico_boricua": "🇵🇷 Político",
+    "ciudadano_boricua": "💪 Ciudadano",
+    "historiador_cultural": "📚 Historiador"
+}
+
+# Topic hashtags added when any of their keywords appears as a word in the content
+WORD_PATTERN = re.compile(r"\w+")
+PR_TOPIC_HASHTAGS: Tuple[Tuple[str, FrozenSet[str]], ...] = (
+    ("#MusicaPR", frozenset({"música", "music", "reggaeton", "salsa"})),
+    ("#ComidaBoricua", frozenset({"comida", "food", "mofongo", "lechón"})),
+    ("#CulturaBoricua", frozenset({"cultura", "culture", "tradición"})),
+)
+
 
 class TwitterAdapter(TwitterProviderPort):
     """
@@ -71,7 +106,7 @@ class TwitterAdapter(TwitterProviderPort):
             return result
             
         except Exception as e:
-            logger.error(f"Error in Twitter adapter post_tweet: {str(e)}")
+            logger.error("Error in Twitter adapter post_tweet: %s", e)
             # Return fallback result
             return TwitterPostResult(
                 success=False,
@@ -108,11 +143,11 @@ class TwitterAdapter(TwitterProviderPort):
             # Filter and sort by Puerto Rico relevance
             filtered_results = self._filter_by_pr_relevance(results)
             
-            logger.info(f"Twitter adapter found {len(filtered_results)} relevant tweets for query: {query}")
+            logger.info("Twitter adapter found %d relevant tweets for query: %s", len(filtered_results), query)
             return filtered_results
             
         except Exception as e:
-            logger.error(f"Error in Twitter adapter search_tweets: {str(e)}")
+            logger.error("Error in Twitter adapter search_tweets: %s", e)
             return []
     
     async def get_user_tweets(
@@ -140,7 +175,7 @@ class TwitterAdapter(TwitterProviderPort):
             return results
             
         except Exception as e:
-            logger.error(f"Error in Twitter adapter get_user_tweets: {str(e)}")
+            logger.error("Error in Twitter adapter get_user_tweets: %s", e)
             return []
     
     async def get_tweet_by_id(self, tweet_id: str) -> Optional[TwitterSearchResult]:
@@ -158,7 +193,7 @@ class TwitterAdapter(TwitterProviderPort):
             return result
             
         except Exception as e:
-            logger.error(f"Error in Twitter adapter get_tweet_by_id: {str(e)}")
+            logger.error("Error in Twitter adapter get_tweet_by_id: %s", e)
             return None
     
     async def delete_tweet(self, tweet_id: str) -> bool:
@@ -167,14 +202,14 @@ class TwitterAdapter(TwitterProviderPort):
             success = await self.twitter_connector.delete_tweet(tweet_id)
             
             if success:
-                logger.info(f"Twitter adapter successfully deleted tweet: {tweet_id}")
+                logger.info("Twitter adapter successfully deleted tweet: %s", tweet_id)
             else:
-                logger.warning(f"Twitter adapter failed to delete tweet: {tweet_id}")
+                logger.warning("Twitter adapter failed to delete tweet: %s", tweet_id)
             
             return success
             
         except Exception as e:
-            logger.error(f"Error in Twitter adapter delete_tweet: {str(e)}")
+            logger.error("Error in Twitter adapter delete_tweet: %s", e)
             return False
     
     async def get_rate_limit_status(self, endpoint: str) -> Optional[TwitterRateLimit]:
@@ -183,7 +218,7 @@ class TwitterAdapter(TwitterProviderPort):
             return await self.twitter_connector.get_rate_limit_status(endpoint)
             
         except Exception as e:
-            logger.error(f"Error in Twitter adapter get_rate_limit_status: {str(e)}")
+            logger.error("Error in Twitter adapter get_rate_limit_status: %s", e)
             return None
     
     async def health_check(self) -> bool:
@@ -192,7 +227,7 @@ class TwitterAdapter(TwitterProviderPort):
             return await self.twitter_connector.health_check()
             
         except Exception as e:
-            logger.error(f"Twitter adapter health check failed: {str(e)}")
+            logger.error("Twitter adapter health check failed: %s", e)
             return False
     
     async def validate_content(self, content: str) -> Dict[str, Any]:
@@ -216,7 +251,7 @@ class TwitterAdapter(TwitterProviderPort):
             return validation
             
         except Exception as e:
-            logger.error(f"Error in Twitter adapter validate_content: {str(e)}")
+            logger.error("Error in Twitter adapter validate_content: %s", e)
             return {
                 "valid": False,
                 "length": len(content),
@@ -243,36 +278,28 @@ class TwitterAdapter(TwitterProviderPort):
         if len(content) > max_content_length:
             content = content[:max_content_length-3] + "..."
         
-        # Add character-specific hashtags based on character type
-        character_hashtags = self._get_character_hashtags(character_id)
+        # Character-specific hashtags plus Puerto Rico hashtags if not present
+        hashtag_text = self._get_character_hashtags(character_id)
+        pr_hashtags = self._get_pr_hashtags(content.lower())
+        if pr_hashtags:
+            hashtag_text = f"{hashtag_text} {' '.join(pr_hashtags)}"
         
-        # Add Puerto Rico hashtags if not present
-        pr_hashtags = self._get_pr_hashtags(content)
+        # Add hashtags if there's space (content + hashtags + signature and two
+        # separating spaces) and they're not already present, then the signature;
+        # the tweet is joined once at the end
+        parts = [content]
+        if (hashtag_text and len(content) + len(hashtag_text) + len(signature) + 2 <= 280
+                and hashtag_text not in content):
+            parts.append(hashtag_text)
+        parts.append(signature)
         
-        # Combine hashtags
-        all_hashtags = character_hashtags + pr_hashtags
-        
-        # Calculate total length with hashtags
-        hashtag_text = " ".join(all_hashtags) if all_hashtags else ""
-        total_length = len(content) + len(signature) + 1 + len(hashtag_text) + (1 if hashtag_text else 0)
-        
-        # Add hashtags if there's space and they're not already present
-        if hashtag_text and total_length <= 280 and hashtag_text not in content:
-            content += f" {hashtag_text}"
-        
-        # Add signature at the end
-        content += f" {signature}"
-        
-        return content
+        return " ".join(parts)
     
     def _enhance_search_query(self, query: str) -> str:
         """Enhance search query for better Puerto Rico relevance."""
         
         # Add Puerto Rico context if not present
-        pr_indicators = ["puerto rico", "boricua", "pr", "🇵🇷"]
-        has_pr_context = any(indicator in query.lower() for indicator in pr_indicators)
-        
-        if not has_pr_context:
+        if PR_QUERY_PATTERN.search(query) is None:
             # Add Puerto Rico context
             enhanced_query = f"{query} (Puerto Rico OR boricua OR PR)"
         else:
@@ -283,19 +310,15 @@ class TwitterAdapter(TwitterProviderPort):
     def _filter_by_pr_relevance(self, results: List[TwitterSearchResult]) -> List[TwitterSearchResult]:
         """Filter and sort results by Puerto Rico relevance."""
         
-        # Sort by Puerto Rico relevance (highest first)
-        sorted_results = sorted(
-            results,
-            key=lambda x: x.puerto_rico_relevance,
-            reverse=True
-        )
-        
-        # Filter out very low relevance results
+        # Filter out very low relevance results first so there is less to sort
         filtered_results = [
-            result for result in sorted_results
+            result for result in results
             if result.puerto_rico_relevance > 0.1 or result.relevance_score > 0.5
         ]
         
+        # Sort by Puerto Rico relevance (highest first), in place on our own list
+        filtered_results.sort(key=attrgetter("puerto_rico_relevance"), reverse=True)
+        
         return filtered_results
     
     def _validate_character_content(self, content: str) -> Dict[str, Any]:
@@ -308,15 +331,12 @@ class TwitterAdapter(TwitterProviderPort):
             warnings.append("Tweet is very short - may not be engaging")
         
         # Check for appropriate emoji usage
-        emoji_count = sum(1 for char in content if ord(char) > 127 and len(char.encode('utf-8')) > 1)
+        emoji_count = len(NON_ASCII_PATTERN.findall(content))
         if emoji_count > 5:
             warnings.append("Many emojis detected - may affect readability")
         
         # Check for Puerto Rico context
-        pr_indicators = ["puerto rico", "boricua", "pr", "🇵🇷", "san juan", "coquí"]
-        has_pr_context = any(indicator in content.lower() for indicator in pr_indicators)
-        
-        if not has_pr_context:
+        if PR_CONTEXT_PATTERN.search(content) is None:
             warnings.append("No Puerto Rico context detected")
         
         return {
@@ -324,47 +344,31 @@ class TwitterAdapter(TwitterProviderPort):
             "errors": errors
         }
     
-    def _get_character_hashtags(self, character_id: str) -> List[str]:
-        """Get character-specific hashtags."""
-        character_hashtags = {
-            "jovani_vazquez": ["#JovaniVazquez", "#PRInfluencer", "#BoricuaVibes"],
-            "politico_boricua": ["#PoliticoBoricua", "#PRPolitics", "#PuertoRico"],
-            "ciudadano_boricua": ["#CiudadanoBoricua", "#VidaBoricua", "#PRDaily"],
-            "historiador_cultural": ["#HistoriaPR", "#CulturaBoricua", "#PatrimonioPR"]
-        }
-        
-        return character_hashtags.get(character_id, ["#PuertoRico"])
+    @staticmethod
+    def _get_character_hashtags(character_id: str) -> str:
+        """Get character-specific hashtags as space-separated tweet text."""
+        return CHARACTER_HASHTAGS.get(character_id, DEFAULT_CHARACTER_HASHTAGS)
     
-    def _get_pr_hashtags(self, content: str) -> List[str]:
-        """Get Puerto Rico hashtags based on content."""
+    @staticmethod
+    def _get_pr_hashtags(content_lower: str) -> List[str]:
+        """Get Puerto Rico hashtags based on lowercased content."""
         hashtags = []
         
         # Add general Puerto Rico hashtag if not present
-        if "🇵🇷" not in content and "puerto rico" not in content.lower():
+        if "🇵🇷" not in content_lower and "puerto rico" not in content_lower:
             hashtags.append("#PuertoRico")
         
-        # Add specific hashtags based on content
-        content_lower = content.lower()
-        
-        if any(word in content_lower for word in ["música", "music", "reggaeton", "salsa"]):
-            hashtags.append("#MusicaPR")
-        
-        if any(word in content_lower for word in ["comida", "food", "mofongo", "lechón"]):
-            hashtags.append("#ComidaBoricua")
-        
-        if any(word in content_lower for word in ["cultura", "culture", "tradición"]):
-            hashtags.append("#CulturaBoricua")
+        # Add specific hashtags based on content, tokenized once
+        words = set(WORD_PATTERN.findall(content_lower))
+        for hashtag, keywords in PR_TOPIC_HASHTAGS:
+            if not keywords.isdisjoint(words):
+                hashtags.append(hashtag)
         
         return hashtags
     
-    def _get_character_signature(self, character_id: str, character_name: str) -> str:
+    @staticmethod
+    def _get_character_signature(character_id: str, character_name: str) -> str:
         """Get character-specific signature for tweets."""
-        signatures = {
-            "jovani_vazquez": "🔥 Jovani",
-            "politico_boricua": "🇵🇷 Político",
-            "ciudadano_boricua": "💪 Ciudadano",
-            "historiador_cultural": "📚 Historiador"
-        }
-        
         # Return character-specific signature or fallback
-        return signatures.get(character_id, f"🤖 {character_name}") 
\ No newline at end of file
+        signature = CHARACTER_SIGNATURES.get(character_id)
+        return signature if signature is not None else f"🤖 {character_name}" 
\ No newline at end of file
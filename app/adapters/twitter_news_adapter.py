@@ -2,17 +2,75 @@
 Twitter News Adapter - Implements NewsProviderPort using Twitter API.
 This adapter discovers news from configured Twitter accounts with smart caching.
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Union
 import asyncio
-import json
 import logging
+import re
+import uuid
+from collections import Counter, defaultdict
 from datetime import datetime, timezone
 from dataclasses import dataclass
+from operator import attrgetter
+
+import orjson
 
 from app.ports.news_provider import NewsProviderPort, TrendingTopic, NewsProviderInfo
 from app.models.conversation import NewsItem
 from app.tools.twitter_connector import TwitterConnector
 from app.services.redis_client import RedisClient
+from app.utils.ttl_cache import TTLCache
+
+# Accounts fetched at once unless the config sets "max_concurrent_fetches";
+# the connector itself waits out Twitter rate limits
+DEFAULT_MAX_CONCURRENT_FETCHES = 4
+
+# News ordering: by relevance, then recency
+NEWS_RANK_KEY = attrgetter("relevance_score", "published_at")
+
+# Redis keys, and how many top news items trending topics are extracted from.
+# Cached news is a sorted set with one serialized item per member
+CACHED_NEWS_KEY = "cached_news:ranked:v2"
+TRENDING_TOPICS_KEY = "trending_topics"
+TRENDING_NEWS_SAMPLE_SIZE = 50
+
+# Ingested items kept in the news cache
+NEWS_CACHE_MAX_ITEMS = 50
+
+# News cache members are positional arrays in this field order, so field names
+# are not repeated in every member (changing it needs a new CACHED_NEWS_KEY)
+NEWS_CACHE_FIELDS = ("id", "headline", "content", "source", "url", "published_at", "relevance_score")
+NEWS_CACHE_VALUES = attrgetter(*NEWS_CACHE_FIELDS)
+
+# Items whose lowercased content and detected category are kept in process,
+# keyed by item id, so cached news is not re-lowered on every pipeline stage
+ITEM_TEXT_CACHE_MAX_ITEMS = 1024
+
+# Item id of tweets that come without an id; shared by all of them, so such
+# items are never cached by id
+UNKNOWN_TWEET_ITEM_ID = "tweet_unknown"
+
+# Sorted-set score: relevance (5 decimals) shifted above a seconds timestamp,
+# so one float orders by relevance, then recency, with no precision loss
+RELEVANCE_SCORE_STEPS = 100_000
+TIMESTAMP_SCORE_RANGE = 10_000_000_000
+
+# Key term extraction: words and hashtags of 4+ characters, with inner
+# apostrophes and hyphens kept so "pa'lante" and "covid-19" stay whole; URLs
+# and mentions are matched as "skip" tokens so their pieces never become terms
+KEY_TERM_PATTERN = re.compile(r"(?P<skip>https?://\S+|@\w+)|(?P<term>[#\w]+(?:['’-][#\w]+)*)")
+KEY_TERM_MIN_LENGTH = 4
+STOP_WORDS = frozenset({"the", "and", "for", "are", "but", "not", "you", "all", "can", "had", "her", "was", "one", "our", "out", "day", "get", "has", "him", "his", "how", "man", "new", "now", "old", "see", "two", "way", "who", "boy", "did", "its", "let", "put", "say", "she", "too", "use"})
+
+# Content-based category detection, one search per category over lowercased
+# content, checked in order (first category with a hit wins)
+CATEGORY_PATTERNS = (
+    ("politics", re.compile(r"política|gobierno|senado|cámara")),
+    ("entertainment", re.compile(r"música|concierto|artista|entretenimiento")),
+    ("culture", re.compile(r"cultura|turismo|museo")),
+)
+
+# Base relevance by source category
+SOURCE_CATEGORY_SCORES = {"news": 0.3, "politics": 0.4, "entertainment": 0.2, "culture": 0.25}
 
 
 @dataclass
@@ -45,6 +103,12 @@ class TwitterNewsAdapter(NewsProviderPort):
         self.twitter = twitter_connector
         self.redis = redis_client
         self.cache_ttl = news_sources_config.get("cache_ttl", 3600)
+        self._fetch_semaphore = asyncio.Semaphore(
+            news_sources_config.get("max_concurrent_fetches", DEFAULT_MAX_CONCURRENT_FETCHES)
+        )
+        # Item id -> (lowercased content, detected category). Kept beside the
+        # items rather than on them, so nothing extra reaches serialization
+        self._item_text = TTLCache(maxsize=ITEM_TEXT_CACHE_MAX_ITEMS, ttl=self.cache_ttl)
         
         # Load news sources from configuration
         self.news_sources = self._load_news_sources(news_sources_config.get("sources", []))
@@ -53,6 +117,13 @@ class TwitterNewsAdapter(NewsProviderPort):
         self.news_keywords = news_sources_config.get("keywords", {})
         self.pr_hashtags = news_sources_config.get("hashtags", {})
         
+        # Lowercased keywords and hashtags with their final score contribution,
+        # so scoring is a single pass with no per-call lowering or multiplying
+        self._relevance_terms = tuple(
+            [(keyword.lower(), weight * 0.1) for keyword, weight in self.news_keywords.items()]
+            + [(hashtag.lower(), weight * 0.2) for hashtag, weight in self.pr_hashtags.items()]
+        )
+        
         self.logger = logging.getLogger(__name__)
 
     def _load_news_sources(self, sources_config: List[Dict[str, Any]]) -> List[NewsSource]:
@@ -127,20 +198,27 @@ class TwitterNewsAdapter(NewsProviderPort):
             List of TrendingTopic objects
         """
         try:
-            # Check cache first
-            cache_key = "trending_topics"
-            cached_topics = await self.redis.get(cache_key)
+            # Check cache first, loading cached topics and cached news in one round-trip
+            cached_topics, cached_news = await self._load_cached_topics_and_news()
             if cached_topics:
-                topics_data = json.loads(cached_topics)
+                topics_data = orjson.loads(cached_topics)
                 return [TrendingTopic(**topic) for topic in topics_data[:max_topics]]
             
-            # Extract trending topics from recent news
-            news_items = await self.discover_latest_news(max_results=50)
-            trending_topics = self._extract_trending_topics(news_items)
+            # Extract trending topics from recent news, fetching from Twitter only
+            # when no news is cached
+            news_items = self._deserialize_news(cached_news) if cached_news else []
+            fetched = not news_items
+            if fetched:
+                news_items = await self._fetch_fresh_news()
+            trending_topics = self._extract_trending_topics(
+                self._filter_news(news_items)[:TRENDING_NEWS_SAMPLE_SIZE]
+            )
             
-            # Cache trending topics
+            # Cache trending topics, plus the news when freshly fetched, in one round-trip
             topics_data = [topic.dict() for topic in trending_topics]
-            await self.redis.setex(cache_key, self.cache_ttl, json.dumps(topics_data))
+            await self._store_cached_topics_and_news(
+                orjson.dumps(topics_data), news_items if fetched else None
+            )
             
             return trending_topics[:max_topics]
             
@@ -177,19 +255,21 @@ class TwitterNewsAdapter(NewsProviderPort):
         """
         try:
             # Calculate relevance score if not provided
+            content_lower = content.lower()
             if relevance_score is None:
-                relevance_score = self._calculate_relevance_score(content, category)
+                relevance_score = self._calculate_relevance_score(content_lower, category)
             
             # Create news item
             news_item = NewsItem(
-                id=f"ingested_{datetime.now(timezone.utc).timestamp()}",
+                id=f"ingested_{uuid.uuid4().hex}",
                 headline=headline,
                 content=content,
                 source=source,
                 url=url,
-                published_at=published_at.isoformat() if published_at else datetime.now(timezone.utc).isoformat(),
+                published_at=(published_at or datetime.now(timezone.utc)).isoformat(),
                 relevance_score=relevance_score
             )
+            self._remember_item_text(news_item, content_lower)
             
             # Add to cache
             await self._add_to_cache(news_item)
@@ -251,59 +331,61 @@ class TwitterNewsAdapter(NewsProviderPort):
 
     async def _fetch_fresh_news(self) -> List[NewsItem]:
         """Fetch fresh news from Twitter accounts."""
-        all_news = []
+        # One clock read per refresh, used for tweets missing a timestamp
+        now_iso = datetime.now(timezone.utc).isoformat()
         
-        for source in self.news_sources:
-            if not source.is_active:
-                continue
-                
-            try:
-                # Fetch latest tweets from this account
-                tweets = await self._fetch_account_tweets(source.username, max_results=5)
-                
-                for tweet in tweets:
-                    # Convert tweet to news item
-                    news_item = await self._tweet_to_news_item(tweet, source)
-                    if news_item:
-                        all_news.append(news_item)
-                
-                # Rate limiting - small delay between accounts
-                await asyncio.sleep(1)
-                
-            except Exception as e:
-                self.logger.error(f"Error fetching tweets from {source.username}: {str(e)}")
-                continue
+        # Fetch active accounts concurrently, bounded by the fetch semaphore
+        source_news = await asyncio.gather(
+            *(self._fetch_source_news(source, now_iso) for source in self.news_sources if source.is_active)
+        )
+        all_news = [news_item for news_items in source_news for news_item in news_items]
         
         # Sort by relevance and recency
-        all_news.sort(key=lambda x: (x.relevance_score, x.published_at), reverse=True)
+        all_news.sort(key=NEWS_RANK_KEY, reverse=True)
         
         return all_news
 
-    async def _fetch_account_tweets(self, username: str, max_results: int = 5) -> List[Dict]:
-        """Fetch latest tweets from a specific account."""
+    async def _fetch_source_news(self, source: NewsSource, now_iso: str) -> List[NewsItem]:
+        """Fetch one account's latest tweets and convert the news-worthy ones."""
+        news_items = []
+        
         try:
-            # Get user ID first
-            user = await self.twitter.get_user_by_username(username)
-            if not user:
-                self.logger.warning(f"User {username} not found")
-                return []
+            # Fetch latest tweets from this account
+            async with self._fetch_semaphore:
+                tweets = await self._fetch_account_tweets(source.username, max_results=5)
+            
+            for tweet in tweets:
+                # Convert tweet to news item
+                news_item = await self._tweet_to_news_item(tweet, source, now_iso)
+                if news_item:
+                    news_items.append(news_item)
             
-            # Get user's tweets
+        except Exception as e:
+            self.logger.error(f"Error fetching tweets from {source.username}: {str(e)}")
+        
+        return news_items
+
+    async def _fetch_account_tweets(self, username: str, max_results: int = 5) -> List[Dict]:
+        """Fetch latest tweets from a specific account, as raw tweet dicts."""
+        try:
+            # The connector caches the username -> user lookup and already
+            # excludes retweets and replies
             tweets = await self.twitter.get_user_tweets(
-                user_id=user["id"],
-                max_results=max_results,
-                exclude_retweets=True,
-                exclude_replies=True
+                username=username,
+                max_results=max_results
             )
             
-            return tweets
+            return [
+                {"id": tweet.tweet_id, "text": tweet.content, "created_at": tweet.created_at.isoformat()}
+                for tweet in tweets
+            ]
             
         except Exception as e:
             self.logger.error(f"Error fetching tweets from {username}: {str(e)}")
             return []
 
-    async def _tweet_to_news_item(self, tweet: Dict, source: NewsSource) -> Optional[NewsItem]:
-        """Convert a tweet to a NewsItem if it's news-worthy."""
+    async def _tweet_to_news_item(self, tweet: Dict, source: NewsSource, now_iso: str) -> Optional[NewsItem]:
+        """Convert a tweet to a NewsItem if it's news-worthy (now_iso is the fallback timestamp)."""
         try:
             content = tweet.get("text", "")
             
@@ -312,7 +394,8 @@ class TwitterNewsAdapter(NewsProviderPort):
                 return None
             
             # Calculate relevance score
-            relevance_score = self._calculate_relevance_score(content, source.category)
+            content_lower = content.lower()
+            relevance_score = self._calculate_relevance_score(content_lower, source.category)
             
             # Skip if relevance is too low
             if relevance_score < 0.3:
@@ -320,14 +403,15 @@ class TwitterNewsAdapter(NewsProviderPort):
             
             # Create news item
             news_item = NewsItem(
-                id=f"tweet_{tweet.get('id', 'unknown')}",
+                id=f"tweet_{tweet['id']}" if "id" in tweet else UNKNOWN_TWEET_ITEM_ID,
                 headline=self._generate_headline(content, source),
                 content=content,
                 source=source.display_name,
                 url=f"https://twitter.com/{source.username}/status/{tweet.get('id')}",
-                published_at=tweet.get("created_at", datetime.now(timezone.utc).isoformat()),
+                published_at=tweet.get("created_at", now_iso),
                 relevance_score=relevance_score
             )
+            self._remember_item_text(news_item, content_lower)
             
             return news_item
             
@@ -335,33 +419,22 @@ class TwitterNewsAdapter(NewsProviderPort):
             self.logger.error(f"Error converting tweet to news item: {str(e)}")
             return None
 
-    def _calculate_relevance_score(self, content: str, category: str) -> float:
-        """Calculate relevance score for content."""
+    def _calculate_relevance_score(self, content_lower: str, category: str) -> float:
+        """Calculate relevance score for already lowercased content."""
         score = 0.0
-        content_lower = content.lower()
         
         # Base score from source category
-        if category == "news":
-            score += 0.3
-        elif category == "politics":
-            score += 0.4
-        elif category == "entertainment":
-            score += 0.2
-        elif category == "culture":
-            score += 0.25
+        score += SOURCE_CATEGORY_SCORES.get(category, 0.0)
         
-        # Add score for news keywords
-        for keyword, weight in self.news_keywords.items():
-            if keyword.lower() in content_lower:
-                score += weight * 0.1
+        # Add score for news keywords and Puerto Rican hashtags, stopping once
+        # the score hits the 1.0 cap
+        for term, weight in self._relevance_terms:
+            if term in content_lower:
+                score += weight
+                if score >= 1.0:
+                    return 1.0
         
-        # Add score for Puerto Rican hashtags
-        for hashtag, weight in self.pr_hashtags.items():
-            if hashtag.lower() in content_lower:
-                score += weight * 0.2
-        
-        # Cap at 1.0
-        return min(score, 1.0)
+        return score
 
     def _generate_headline(self, content: str, source: NewsSource) -> str:
         """Generate a headline from tweet content."""
@@ -383,6 +456,11 @@ class TwitterNewsAdapter(NewsProviderPort):
         min_relevance_score: float = 0.3
     ) -> List[NewsItem]:
         """Filter news items by categories and relevance score."""
+        # Without categories only the relevance score matters
+        if not categories:
+            return [item for item in news_items if item.relevance_score >= min_relevance_score]
+        
+        categories_set = set(categories)
         filtered = []
         
         for item in news_items:
@@ -390,96 +468,118 @@ class TwitterNewsAdapter(NewsProviderPort):
             if item.relevance_score < min_relevance_score:
                 continue
             
-            # Check categories if specified
-            if categories:
-                # For now, we'll use a simple approach - check if any category keywords are in the content
-                content_lower = item.content.lower()
-                item_category = "general"
-                
-                if any(keyword in content_lower for keyword in ["política", "gobierno", "senado", "cámara"]):
-                    item_category = "politics"
-                elif any(keyword in content_lower for keyword in ["música", "concierto", "artista", "entretenimiento"]):
-                    item_category = "entertainment"
-                elif any(keyword in content_lower for keyword in ["cultura", "turismo", "museo"]):
-                    item_category = "culture"
-                
-                if item_category not in categories:
-                    continue
+            # Check categories, detected from the content
+            if self._get_item_text(item)[1] not in categories_set:
+                continue
             
             filtered.append(item)
         
         return filtered
 
+    def _detect_category(self, content_lower: str) -> str:
+        """Simple category detection based on keywords in already lowercased content."""
+        for category, pattern in CATEGORY_PATTERNS:
+            if pattern.search(content_lower):
+                return category
+        return "general"
+
+    def _remember_item_text(self, news_item: NewsItem, content_lower: str) -> Tuple[str, str]:
+        """Store an item's lowercased content and detected category (unless its id is not unique)."""
+        item_text = (content_lower, self._detect_category(content_lower))
+        if news_item.id != UNKNOWN_TWEET_ITEM_ID:
+            self._item_text.set(news_item.id, item_text)
+        return item_text
+
+    def _get_item_text(self, news_item: NewsItem) -> Tuple[str, str]:
+        """Get an item's (lowercased content, category), computing it on a miss."""
+        item_text = None
+        if news_item.id != UNKNOWN_TWEET_ITEM_ID:
+            item_text = self._item_text.get(news_item.id)
+        if item_text is None:
+            item_text = self._remember_item_text(news_item, news_item.content.lower())
+        return item_text
+
     def _extract_trending_topics(self, news_items: List[NewsItem]) -> List[TrendingTopic]:
         """Extract trending topics from news items."""
-        topic_counts = {}
+        topic_counts: Counter = Counter()
+        relevance_sums: Dict[str, float] = defaultdict(float)
         
         for item in news_items:
             # Extract key terms from content
-            terms = self._extract_key_terms(item.content)
+            terms = self._extract_key_terms(self._get_item_text(item)[0])
+            topic_counts.update(terms)
             
+            relevance = item.relevance_score
             for term in terms:
-                if term not in topic_counts:
-                    topic_counts[term] = {
-                        "count": 0,
-                        "relevance": 0.0,
-                        "category": "general"
-                    }
-                
-                topic_counts[term]["count"] += 1
-                topic_counts[term]["relevance"] += item.relevance_score
+                relevance_sums[term] += relevance
         
-        # Convert to TrendingTopic objects
-        trending_topics = []
-        for term, data in topic_counts.items():
-            if data["count"] >= 2:  # Only include terms that appear multiple times
-                topic = TrendingTopic(
-                    term=term,
-                    count=data["count"],
-                    relevance=data["relevance"] / data["count"],  # Average relevance
-                    category=data["category"]
-                )
-                trending_topics.append(topic)
+        # Convert to TrendingTopic objects, only for terms that appear multiple times
+        trending_topics = [
+            TrendingTopic(
+                term=term,
+                count=count,
+                relevance=relevance_sums[term] / count,  # Average relevance
+                category="general"
+            )
+            for term, count in topic_counts.items()
+            if count >= 2
+        ]
         
         # Sort by count and relevance
-        trending_topics.sort(key=lambda x: (x.count, x.relevance), reverse=True)
+        trending_topics.sort(key=attrgetter("count", "relevance"), reverse=True)
         
         return trending_topics
 
-    def _extract_key_terms(self, content: str) -> List[str]:
-        """Extract key terms from content."""
-        # Simple term extraction - split by spaces and filter
-        words = content.lower().split()
+    def _extract_key_terms(self, content_lower: str) -> List[str]:
+        """Extract key terms from already lowercased content."""
+        # Simple term extraction - one regex pass tokenizes and drops short
+        # words and punctuation; stop the scan once we have enough terms
         terms = []
         
-        for word in words:
-            # Remove common words and short words
-            if len(word) > 3 and word not in ["the", "and", "for", "are", "but", "not", "you", "all", "can", "had", "her", "was", "one", "our", "out", "day", "get", "has", "him", "his", "how", "man", "new", "now", "old", "see", "two", "way", "who", "boy", "did", "its", "let", "put", "say", "she", "too", "use"]:
-                # Remove punctuation
-                word = word.strip(".,!?;:()[]{}'\"")
-                if word:
-                    terms.append(word)
+        for match in KEY_TERM_PATTERN.finditer(content_lower):
+            term = match.group("term")
+            if term and len(term) >= KEY_TERM_MIN_LENGTH and term not in STOP_WORDS:
+                terms.append(term)
+                if len(terms) == 10:  # Limit to top 10 terms
+                    break
         
-        return terms[:10]  # Limit to top 10 terms
+        return terms
+
+    def _serialize_news_item(self, news_item: NewsItem) -> bytes:
+        """Serialize a news item as a news cache member (a NEWS_CACHE_FIELDS array)."""
+        return orjson.dumps(NEWS_CACHE_VALUES(news_item))
+
+    def _deserialize_news(self, members: List[Union[str, bytes]]) -> List[NewsItem]:
+        """Deserialize news cache members (highest score first) into news items."""
+        return [NewsItem(**dict(zip(NEWS_CACHE_FIELDS, orjson.loads(member)))) for member in members]
+
+    def _cache_score(self, news_item: NewsItem) -> float:
+        """Sorted-set score matching the (relevance_score, published_at) news ordering."""
+        published_at = news_item.published_at
+        try:
+            if isinstance(published_at, str):
+                published_at = datetime.fromisoformat(published_at)
+            timestamp = int(published_at.timestamp())
+        except (AttributeError, ValueError):
+            timestamp = 0
+        timestamp = min(max(timestamp, 0), TIMESTAMP_SCORE_RANGE - 1)
+        return round(news_item.relevance_score * RELEVANCE_SCORE_STEPS) * TIMESTAMP_SCORE_RANGE + timestamp
+
+    def _queue_news_replace(self, pipe, news_items: List[NewsItem]):
+        """Queue commands on a pipeline that replace the news cache with these items."""
+        pipe.delete(CACHED_NEWS_KEY)
+        if news_items:
+            pipe.zadd(CACHED_NEWS_KEY, {
+                self._serialize_news_item(item): self._cache_score(item) for item in news_items
+            })
+            pipe.expire(CACHED_NEWS_KEY, self.cache_ttl)
 
     async def _cache_news(self, news_items: List[NewsItem]):
         """Cache news items in Redis."""
         try:
-            cache_key = "cached_news"
-            news_data = []
-            
-            for item in news_items:
-                news_data.append({
-                    "id": item.id,
-                    "headline": item.headline,
-                    "content": item.content,
-                    "source": item.source,
-                    "url": item.url,
-                    "published_at": item.published_at,
-                    "relevance_score": item.relevance_score
-                })
-            
-            await self.redis.setex(cache_key, self.cache_ttl, json.dumps(news_data))
+            async with await self.redis.pipeline(transaction=True) as pipe:
+                self._queue_news_replace(pipe, news_items)
+                await pipe.execute()
             self.logger.info(f"Cached {len(news_items)} news items")
             
         except Exception as e:
@@ -488,41 +588,48 @@ class TwitterNewsAdapter(NewsProviderPort):
     async def _get_cached_news(self) -> List[NewsItem]:
         """Get cached news items from Redis."""
         try:
-            cache_key = "cached_news"
-            cached_data = await self.redis.get(cache_key)
-            
-            if cached_data:
-                news_data = json.loads(cached_data)
-                news_items = []
-                
-                for item_data in news_data:
-                    news_item = NewsItem(**item_data)
-                    news_items.append(news_item)
-                
-                return news_items
+            return self._deserialize_news(await self.redis.zrevrange(CACHED_NEWS_KEY))
             
+        except Exception as e:
+            self.logger.error(f"Error getting cached news: {str(e)}")
             return []
+
+    async def _load_cached_topics_and_news(self) -> Tuple[Optional[bytes], List[bytes]]:
+        """Read cached trending topics and cached news in one pipelined round-trip."""
+        try:
+            async with await self.redis.pipeline() as pipe:
+                pipe.get(TRENDING_TOPICS_KEY)
+                pipe.zrevrange(CACHED_NEWS_KEY, 0, -1)
+                cached_topics, cached_news = await pipe.execute()
+            return cached_topics, cached_news
             
         except Exception as e:
-            self.logger.error(f"Error getting cached news: {str(e)}")
+            # Same as a cache miss, like the RedisClient helpers
+            self.logger.error(f"Error reading cached topics and news: {str(e)}")
+            return None, []
+
+    async def _store_cached_topics_and_news(self, topics_data: bytes, news_items: Optional[List[NewsItem]]):
+        """Write trending topics, and news if given, in one pipelined round-trip."""
+        try:
+            async with await self.redis.pipeline(transaction=True) as pipe:
+                pipe.setex(TRENDING_TOPICS_KEY, self.cache_ttl, topics_data)
+                if news_items is not None:
+                    self._queue_news_replace(pipe, news_items)
+                await pipe.execute()
+            
+        except Exception as e:
+            self.logger.error(f"Error caching topics and news: {str(e)}")
 
     async def _add_to_cache(self, news_item: NewsItem):
         """Add a single news item to cache."""
         try:
-            # Get existing cached news
-            cached_news = await self._get_cached_news()
-            
-            # Add new item
-            cached_news.append(news_item)
-            
-            # Sort by relevance and recency
-            cached_news.sort(key=lambda x: (x.relevance_score, x.published_at), reverse=True)
-            
-            # Keep only top 50 items
-            cached_news = cached_news[:50]
-            
-            # Update cache
-            await self._cache_news(cached_news)
+            # Insert in rank order and trim to the top items server-side, without
+            # reading the cache back
+            async with await self.redis.pipeline(transaction=True) as pipe:
+                pipe.zadd(CACHED_NEWS_KEY, {self._serialize_news_item(news_item): self._cache_score(news_item)})
+                pipe.zremrangebyrank(CACHED_NEWS_KEY, 0, -(NEWS_CACHE_MAX_ITEMS + 1))
+                pipe.expire(CACHED_NEWS_KEY, self.cache_ttl)
+                await pipe.execute()
             
         except Exception as e:
-            self.logger.error(f"Error adding to cache: {str(e)}") 
\ No newline at end of file
+            self.logger.error(f"Error adding to cache: {str(e)}")
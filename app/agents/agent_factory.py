@@ -4,6 +4,8 @@ Simple factory for creating character agents.
 from typing import Optional, Dict, List
 import logging
 import os
+from functools import lru_cache
+from types import MappingProxyType
 
 from app.ports.ai_provider import AIProviderPort
 from app.ports.personality_port import PersonalityPort
@@ -13,6 +15,31 @@ from app.models.personalities.personality_factory import get_personality_by_id
 
 logger = logging.getLogger(__name__)
 
+# Registry of custom agent creators (read-only; AgentFactory keeps its own copy
+# so register_custom_agent can extend it)
+CUSTOM_AGENT_CREATORS = MappingProxyType({
+    "jovani_vazquez": create_jovani_vazquez,
+    # Add other custom agents here as they're created
+})
+
+
+@lru_cache(maxsize=64)
+def _get_personality(character_id: str) -> PersonalityPort:
+    """
+    Look up a character's personality once and share it between its agents.
+
+    Personalities are read-only configuration; call _get_personality.cache_clear()
+    after reloading personality configs. A missing personality raises instead of
+    returning None, so misses are never cached and a personality added later is found.
+
+    Raises:
+        ValueError: If no personality exists for the character
+    """
+    personality = get_personality_by_id(character_id)
+    if not personality:
+        raise ValueError(f"No personality found for character: {character_id}")
+    return personality
+
 
 class AgentFactory:
     """
@@ -28,10 +55,7 @@ class AgentFactory:
         if os.environ.get("CUENTAMELO_AGENT_FACTORY_MODE") == "mock" and not os.environ.get("PYTEST_CURRENT_TEST"):
             logger.warning("AgentFactory is running in mock mode outside of test context! This should only be used for tests.")
         self._active_agents: Dict[str, BaseCharacterAgent] = {}
-        self._custom_agent_creators = {
-            "jovani_vazquez": create_jovani_vazquez,
-            # Add other custom agents here as they're created
-        }
+        self._custom_agent_creators = dict(CUSTOM_AGENT_CREATORS)
     
     def create_agent(
         self,
@@ -69,9 +93,7 @@ class AgentFactory:
 
             # Get personality if not provided
             if not personality:
-                personality = get_personality_by_id(character_id)
-                if not personality:
-                    raise ValueError(f"No personality found for character: {character_id}")
+                personality = _get_personality(character_id)
 
             # Create standard agent using enhanced BaseCharacterAgent
             agent = BaseCharacterAgent(
@@ -157,12 +179,6 @@ def create_agent(
     Raises:
         ValueError: If character_id is not recognized
     """
-    # Registry of custom agent creators
-    CUSTOM_AGENT_CREATORS = {
-        "jovani_vazquez": create_jovani_vazquez,
-        # Add other custom agents here as they're created
-    }
-
     # Check if this character has a custom agent implementation
     if character_id in CUSTOM_AGENT_CREATORS:
         logger.info(f"Creating custom agent for character: {character_id}")
@@ -176,9 +192,7 @@ def create_agent(
 
     # Get personality if not provided
     if not personality:
-        personality = get_personality_by_id(character_id)
-        if not personality:
-            raise ValueError(f"No personality found for character: {character_id}")
+        personality = _get_personality(character_id)
 
     # Create standard agent using enhanced BaseCharacterAgent
     return BaseCharacterAgent(
@@ -190,17 +204,11 @@ def create_agent(
 
 def is_custom_agent(character_id: str) -> bool:
     """Check if a character uses a custom agent."""
-    CUSTOM_AGENT_CREATORS = {
-        "jovani_vazquez": create_jovani_vazquez,
-    }
     return character_id in CUSTOM_AGENT_CREATORS
 
 
 def list_custom_agents() -> list[str]:
     """Get list of characters that use custom agents."""
-    CUSTOM_AGENT_CREATORS = {
-        "jovani_vazquez": create_jovani_vazquez,
-    }
     return list(CUSTOM_AGENT_CREATORS.keys())
 
 
@@ -27,6 +27,12 @@ class Settings(BaseSettings):
     posting_rate_limit: int = 10
     interaction_cooldown: int = 900
     max_conversation_turns: int = 6
+    # Sampling temperature for Claude generations; at 0.2 or below responses
+    # are stable enough to be served from the adapter's response cache
+    claude_temperature: float = 0.7
+
+    # Performance settings
+    claude_max_concurrency: int = 8
 
     # N8N Integration Settings
     N8N_WEBHOOK_URL: str = "http://localhost:5678"
@@ -5,6 +5,7 @@ Manages the complete character response lifecycle from content analysis to posti
 from typing import Dict, List, Optional, Any, TypedDict
 import asyncio
 import logging
+from functools import lru_cache
 from datetime import datetime, timezone
 
 from langgraph.graph import StateGraph, START, END
@@ -113,6 +114,12 @@ def create_character_workflow() -> StateGraph:
     return workflow
 
 
+@lru_cache(maxsize=1)
+def get_character_workflow() -> StateGraph:
+    """Get the character workflow definition shared by every execution (compiled once by the executor)."""
+    return create_character_workflow()
+
+
 # Node implementations
 
 async def initialize_agent_state(state: CharacterWorkflowState) -> CharacterWorkflowState:
@@ -579,7 +586,7 @@ async def execute_character_workflow(
         )
         
         # Create workflow
-        workflow = create_character_workflow()
+        workflow = get_character_workflow()
         
         # Use injected workflow executor or create default
         if workflow_executor is None:
@@ -5,6 +5,7 @@ Coordinates multiple characters, manages news processing, and handles character
 from typing import Dict, List, Optional, Any, TypedDict
 import asyncio
 import logging
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
 
 from langgraph.graph import StateGraph, START, END
@@ -92,6 +93,17 @@ def create_orchestration_workflow() -> StateGraph:
     return workflow
 
 
+@lru_cache(maxsize=1)
+def get_orchestration_workflow() -> StateGraph:
+    """
+    Get the shared master orchestration workflow definition.
+
+    The graph shape never changes, so one definition is built and reused;
+    this lets the workflow executor cache its compiled form across runs.
+    """
+    return create_orchestration_workflow()
+
+
 # Character registry and factory functions
 def get_available_characters() -> Dict[str, BaseCharacterAgent]:
     """Get all available character agents."""
@@ -494,7 +506,7 @@ async def execute_orchestration_cycle(
     Returns:
         OrchestrationWorkflowState: Final workflow state
     """
-    workflow = create_orchestration_workflow()
+    workflow = get_orchestration_workflow()
     
     # Prepare orchestration state
     if existing_state:
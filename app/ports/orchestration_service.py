@@ -4,7 +4,7 @@ This is the key abstraction that hides LangGraph complexity from external consum
 """
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 
 from app.models.conversation import NewsItem, ConversationThread, CharacterReaction
@@ -21,6 +21,8 @@ class OrchestrationRequest(BaseModel):
 
 class OrchestrationResult(BaseModel):
     """Result of orchestration processing."""
+    model_config = ConfigDict(frozen=True)  # Immutable value objects, never mutated after construction
+    
     success: bool
     execution_time_ms: int
     characters_processed: List[str]
@@ -32,6 +34,8 @@ class OrchestrationResult(BaseModel):
 
 class SystemStatus(BaseModel):
     """Current status of the orchestration system."""
+    model_config = ConfigDict(frozen=True)
+    
     active: bool
     active_characters: List[str]
     pending_news_count: int
@@ -43,6 +47,8 @@ class SystemStatus(BaseModel):
 
 class CharacterStatus(BaseModel):
     """Status of an individual character."""
+    model_config = ConfigDict(frozen=True)
+    
     character_id: str
     character_name: str
     available: bool
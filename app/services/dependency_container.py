@@ -19,7 +19,7 @@ from app.adapters.langgraph_orchestration_adapter import LangGraphOrchestrationA
 from app.adapters.twitter_news_adapter import TwitterNewsAdapter
 from app.adapters.simulated_news_adapter import SimulatedNewsAdapter
 from app.adapters.elnuevodia_news_adapter import ElNuevoDiaNewsAdapter
-from app.tools.claude_client import ClaudeClient
+from app.tools.claude_client import get_shared_claude_client
 from app.tools.twitter_connector import TwitterConnector
 from app.services.personality_config_loader import PersonalityConfigLoader
 from app.services.redis_client import RedisClient
@@ -73,8 +73,8 @@ class DependencyContainer:
             provider_type = self.config.get("ai_provider", "claude")
             
             if provider_type == "claude":
-                # Create Claude client with dependency injection
-                claude_client = ClaudeClient(
+                # Inject the shared Claude client so adapters reuse one connection pool
+                claude_client = get_shared_claude_client(
                     api_key=self.settings.ANTHROPIC_API_KEY
                 )
                 self._services["ai_provider"] = ClaudeAIAdapter(claude_client)
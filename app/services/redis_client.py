@@ -117,6 +117,80 @@ class RedisClient:
             logger.error(f"Redis delete failed for key {key}: {str(e)}")
             return False
     
+    async def delete_pattern(self, pattern: str, batch_size: int = 500) -> int:
+        """
+        Delete all keys matching a glob pattern.
+
+        Uses cursored SCAN (non-blocking, unlike KEYS) and deletes the
+        matches in pipelined batches.
+
+        Args:
+            pattern: Glob-style key pattern (e.g. "prefix:*")
+            batch_size: Number of keys deleted per pipeline round-trip
+
+        Returns:
+            Number of keys deleted
+        """
+        try:
+            client = await self._get_client()
+            deleted = 0
+            batch = []
+            async for key in client.scan_iter(match=pattern, count=batch_size):
+                batch.append(key)
+                if len(batch) >= batch_size:
+                    deleted += await self._delete_batch(client, batch)
+                    batch = []
+            if batch:
+                deleted += await self._delete_batch(client, batch)
+            return deleted
+        except Exception as e:
+            logger.error(f"Redis delete failed for pattern {pattern}: {str(e)}")
+            return 0
+
+    async def _delete_batch(self, client, keys: list) -> int:
+        """Delete a batch of keys in a single pipeline round-trip."""
+        pipe = client.pipeline(transaction=False)
+        for key in keys:
+            pipe.delete(key)
+        results = await pipe.execute()
+        return sum(results)
+
+    async def zrevrange(self, key: str, start: int = 0, end: int = -1) -> list:
+        """
+        Get sorted set members ordered from highest to lowest score.
+
+        Args:
+            key: Redis key
+            start: First rank to return
+            end: Last rank to return (-1 for all)
+
+        Returns:
+            Members as strings, or an empty list if missing or on failure
+        """
+        try:
+            client = await self._get_client()
+            members = await client.zrevrange(key, start, end)
+            return [member.decode('utf-8') for member in members]
+        except Exception as e:
+            logger.error(f"Redis zrevrange failed for key {key}: {str(e)}")
+            return []
+
+    async def pipeline(self, transaction: bool = False):
+        """
+        Get a pipeline for batching several commands into one round-trip.
+
+        Unlike the other helpers this does not swallow errors, and replies
+        come back raw (bytes), so callers handle both.
+
+        Args:
+            transaction: Wrap the batch in MULTI/EXEC
+
+        Returns:
+            Redis pipeline, usable as an async context manager
+        """
+        client = await self._get_client()
+        return client.pipeline(transaction=transaction)
+
     async def exists(self, key: str) -> bool:
         """
         Check if key exists in Redis.
@@ -2,8 +2,10 @@
 Claude API client for character personality generation and conversation management.
 """
 import asyncio
-from typing import Dict, List, Optional, Any, Tuple
-from anthropic import AsyncAnthropic
+import threading
+from typing import Dict, List, Optional, Any, Tuple, AsyncIterator
+import httpx
+from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
 from pydantic import BaseModel
 import logging
 from app.config import get_settings
@@ -11,6 +13,13 @@ from app.config import get_settings
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Connection pool limits for the HTTP client behind each ClaudeClient
+HTTP_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=32,
+    max_connections=64,
+    keepalive_expiry=60
+)
+
 
 class PersonalityPrompt(BaseModel):
     """Structured prompt for character personality generation."""
@@ -30,6 +39,8 @@ class ClaudeResponse(BaseModel):
     character_consistency: bool
     estimated_tokens: int
     response_time_ms: int
+    cache_read_tokens: int = 0
+    error: Optional[str] = None
 
 
 class ClaudeClient:
@@ -45,18 +56,20 @@ class ClaudeClient:
     
     def __init__(self, api_key: Optional[str] = None):
         self.client = AsyncAnthropic(
-            api_key=api_key or settings.ANTHROPIC_API_KEY
+            api_key=api_key or settings.ANTHROPIC_API_KEY,
+            http_client=DefaultAsyncHttpxClient(limits=HTTP_POOL_LIMITS)
         )
         self.model = "claude-3-5-sonnet-20241022"
         self.max_tokens = 1000
-        self.temperature = 0.7
+        self.temperature = settings.claude_temperature
         
     async def generate_character_response(
         self,
         character_prompt: PersonalityPrompt,
         context: str,
         conversation_history: List[Dict[str, Any]] = None,
-        target_topic: str = None
+        target_topic: str = None,
+        system_prefix: Optional[str] = None
     ) -> ClaudeResponse:
         """
         Generate a character response using Claude API with personality consistency.
@@ -66,6 +79,7 @@ class ClaudeClient:
             context: Current context or news item to respond to
             conversation_history: Previous conversation context
             target_topic: Specific topic to focus the response on
+            system_prefix: Static character instructions appended to the cached system prompt
             
         Returns:
             ClaudeResponse with generated content and metadata
@@ -73,8 +87,8 @@ class ClaudeClient:
         start_time = asyncio.get_event_loop().time()
         
         try:
-            # Build the system prompt for character consistency
-            system_prompt = self._build_character_system_prompt(character_prompt)
+            # Build the cacheable system prompt for character consistency
+            system_blocks = self._build_system_blocks(character_prompt, system_prefix)
             
             # Build the user prompt with context
             user_prompt = self._build_context_prompt(
@@ -86,7 +100,7 @@ class ClaudeClient:
                 model=self.model,
                 max_tokens=self.max_tokens,
                 temperature=self.temperature,
-                system=system_prompt,
+                system=system_blocks,
                 messages=[{"role": "user", "content": user_prompt}]
             )
             
@@ -107,20 +121,94 @@ class ClaudeClient:
                 confidence_score=0.85,  # TODO: Implement proper confidence scoring
                 character_consistency=consistency_check,
                 estimated_tokens=response.usage.output_tokens,
-                response_time_ms=response_time_ms
+                response_time_ms=response_time_ms,
+                cache_read_tokens=getattr(response.usage, "cache_read_input_tokens", 0) or 0
             )
             
         except Exception as e:
-            logger.error(f"Error generating character response: {str(e)}")
+            logger.error("Error generating character response: %s", e)
             # Return a fallback response
             return ClaudeResponse(
                 content=f"[Error generating response for {character_prompt.character_name}]",
                 confidence_score=0.0,
                 character_consistency=False,
                 estimated_tokens=0,
-                response_time_ms=int((asyncio.get_event_loop().time() - start_time) * 1000)
+                response_time_ms=int((asyncio.get_event_loop().time() - start_time) * 1000),
+                error=str(e)
             )
     
+    async def stream_character_response(
+        self,
+        character_prompt: PersonalityPrompt,
+        context: str,
+        conversation_history: List[Dict[str, Any]] = None,
+        target_topic: str = None,
+        system_prefix: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream a character response as text chunks while Claude generates it.
+        
+        Takes the same arguments as generate_character_response. Unlike that method,
+        API errors are raised to the caller, since a partial stream cannot be
+        replaced with a fallback response.
+        
+        Yields:
+            Text deltas in generation order
+        """
+        system_blocks = self._build_system_blocks(character_prompt, system_prefix)
+        user_prompt = self._build_context_prompt(
+            context, conversation_history, target_topic
+        )
+        
+        async with self.client.messages.stream(
+            model=self.model,
+            max_tokens=self.max_tokens,
+            temperature=self.temperature,
+            system=system_blocks,
+            messages=[{"role": "user", "content": user_prompt}]
+        ) as stream:
+            async for text in stream.text_stream:
+                yield text
+    
+    async def ping(self) -> bool:
+        """
+        Check API availability with a cheap metadata request.
+        
+        Retrieves the configured model instead of running a completion, so
+        liveness probes cost no tokens and return in milliseconds.
+        """
+        try:
+            await self.client.models.retrieve(self.model)
+            return True
+        except Exception as e:
+            logger.error("Claude API ping failed: %s", e)
+            return False
+    
+    def _build_system_blocks(
+        self,
+        character_prompt: PersonalityPrompt,
+        system_prefix: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Build system content blocks with the static personality prompt marked for caching.
+        
+        Everything in the system prompt depends only on the character, so it is sent
+        as a single block with an ephemeral cache breakpoint at its end. Anthropic then
+        reuses the cached prefix across calls and only the user message is billed as
+        fresh input.
+        """
+        system_prompt = self._build_character_system_prompt(character_prompt)
+        if system_prefix:
+            system_prompt = f"{system_prompt}\n\n{system_prefix}"
+        
+        return [
+            {
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"}
+            }
+        ]
+    
     def _build_character_system_prompt(self, character_prompt: PersonalityPrompt) -> str:
         """Build system prompt for character personality consistency."""
         
@@ -385,7 +473,7 @@ You are {character_name}, a Puerto Rican AI character. Maintain your unique pers
             return True
             
         except Exception as e:
-            logger.error(f"Error validating personality consistency: {str(e)}")
+            logger.error("Error validating personality consistency: %s", e)
             return False
     
     async def generate_news_reaction(
@@ -464,8 +552,27 @@ Keep it engaging and authentic to your personality.
         )
 
 
+_shared_clients: Dict[str, ClaudeClient] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def get_shared_claude_client(api_key: Optional[str] = None) -> ClaudeClient:
+    """
+    Get the process-wide Claude client for an API key.
+    
+    Each client owns an HTTP connection pool, so sharing one per key lets every
+    adapter reuse warm keep-alive connections instead of paying a new TLS handshake.
+    """
+    key = api_key or settings.ANTHROPIC_API_KEY
+    with _shared_clients_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            client = _shared_clients[key] = ClaudeClient(api_key=key)
+    return client
+
+
 # Global client instance
-claude_client = ClaudeClient()
+claude_client = get_shared_claude_client()
 
 
 async def get_claude_client() -> ClaudeClient:
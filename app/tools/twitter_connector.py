@@ -18,10 +18,15 @@ from app.ports.twitter_provider import (
 )
 from app.config import get_settings
 from app.utils.event_decorators import emit_post_published
+from app.utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Username -> user lookups barely ever change, so they are cached for a week
+USER_CACHE_TTL_SECONDS = 7 * 24 * 3600
+USER_CACHE_MAX_ENTRIES = 256
+
 
 class TwitterConnector(TwitterProviderPort):
     """
@@ -74,6 +79,9 @@ class TwitterConnector(TwitterProviderPort):
         self.rate_limits: Dict[str, TwitterRateLimit] = {}
         self.last_api_call: Dict[str, datetime] = {}
         
+        # Lowercased username -> user, so repeated timeline fetches skip the user lookup
+        self._users = TTLCache(maxsize=USER_CACHE_MAX_ENTRIES, ttl=USER_CACHE_TTL_SECONDS)
+        
         logger.info("Twitter connector initialized")
     
     @emit_post_published()
@@ -246,16 +254,13 @@ class TwitterConnector(TwitterProviderPort):
         """Get tweets from a specific user."""
         try:
             # Get user ID first
-            user_response = await asyncio.to_thread(
-                self.client.get_user,
-                username=username
-            )
+            user = await self._get_user(username)
             
-            if not user_response.data:
+            if not user:
                 logger.warning(f"User not found: {username}")
                 return []
             
-            user_id = user_response.data.id
+            user_id = user.id
             
             # Get user tweets
             params = {
@@ -281,7 +286,7 @@ class TwitterConnector(TwitterProviderPort):
                         tweet_id=str(tweet.id),  # Convert to string
                         content=tweet.text,
                         author_username=username,
-                        author_name=user_response.data.name,
+                        author_name=user.name,
                         created_at=tweet.created_at,
                         engagement_metrics=tweet.public_metrics,
                         puerto_rico_relevance=self._calculate_pr_relevance(tweet.text)
@@ -295,6 +300,24 @@ class TwitterConnector(TwitterProviderPort):
             logger.error(f"Twitter API error when getting user tweets: {str(e)}")
             return []
     
+    async def _get_user(self, username: str) -> Optional[Any]:
+        """Look up a user by username, from the user cache when possible."""
+        cache_key = username.lower()
+        user = self._users.get(cache_key)
+        if user is not None:
+            return user
+        
+        user_response = await asyncio.to_thread(
+            self.client.get_user,
+            username=username
+        )
+        
+        # Missing users are not cached, so they are looked up again next time
+        user = user_response.data
+        if user:
+            self._users.set(cache_key, user)
+        return user
+    
     async def get_tweet_by_id(self, tweet_id: str) -> Optional[TwitterSearchResult]:
         """Get a specific tweet by ID."""
         try:
@@ -0,0 +1,66 @@
+"""
+Minimal circuit breaker for calls to external services.
+Lets callers fail fast while a dependency is known to be down.
+"""
+import time
+from enum import Enum
+from typing import Optional
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open."""
+    pass
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open circuit breaker.
+    
+    After failure_threshold consecutive failures the circuit opens and
+    allow_request() returns False. Once recovery_timeout seconds have passed the
+    circuit is half-open: requests are let through, the first success closes
+    the circuit and the first failure opens it again.
+    """
+    
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        """
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds to stay open before trying again
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._failure_count = 0
+        self._opened_at: Optional[float] = None
+    
+    @property
+    def state(self) -> CircuitState:
+        """Current circuit state."""
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if time.monotonic() - self._opened_at >= self.recovery_timeout:
+            return CircuitState.HALF_OPEN
+        return CircuitState.OPEN
+    
+    def allow_request(self) -> bool:
+        """Whether a call should be attempted right now."""
+        return self.state != CircuitState.OPEN
+    
+    def record_success(self) -> None:
+        """Record a successful call, closing the circuit."""
+        self._failure_count = 0
+        self._opened_at = None
+    
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit once the threshold is hit."""
+        self._failure_count += 1
+        if self._opened_at is not None or self._failure_count >= self.failure_threshold:
+            # A failure while half-open restarts the recovery timeout
+            self._opened_at = time.monotonic()
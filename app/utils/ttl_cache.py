@@ -0,0 +1,62 @@
+"""
+In-process TTL cache with LRU eviction.
+Used as a cheap first-level cache in front of slower backends (Claude API, Redis).
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Bounded mapping whose entries expire a fixed number of seconds after being set.
+    
+    When full, the least recently used entry is evicted. Expiry uses
+    time.monotonic(), so wall-clock adjustments never resurrect stale entries.
+    Not thread-safe - intended for use from a single event loop.
+    """
+    
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Seconds an entry stays valid after being set
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+    
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Get a live entry, or default if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+        
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store an entry, evicting the least recently used one if full."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Remove an entry and return its value (expired entries return default)."""
+        entry = self._entries.pop(key, None)
+        if entry is None or entry[0] <= time.monotonic():
+            return default
+        return entry[1]
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
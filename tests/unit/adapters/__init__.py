@@ -0,0 +1 @@
+# Test adapters package
\ No newline at end of file
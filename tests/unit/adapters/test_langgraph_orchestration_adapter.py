@@ -0,0 +1,89 @@
+"""
+Tests for the LangGraph orchestration adapter.
+"""
+import asyncio
+import pytest
+from unittest.mock import Mock, patch
+from datetime import datetime, timedelta, timezone
+
+from app.adapters.langgraph_orchestration_adapter import LangGraphOrchestrationAdapter
+from app.models.conversation import is_character_available
+from app.ports.orchestration_service import OrchestrationRequest
+
+
+async def fake_orchestration_cycle(news_items=None, existing_state=None):
+    """
+    Stand-in for execute_orchestration_cycle with the same state access pattern:
+    queue the news, pop one item, check availability, yield to the event loop
+    (as the real character workflow does), then put the character on cooldown.
+    """
+    existing_state.pending_news_queue.extend(news_items or [])
+    existing_state.pending_news_queue.pop(0)
+    
+    processing_characters = [
+        char_id for char_id, char_state in existing_state.character_states.items()
+        if is_character_available(char_state)
+    ]
+    
+    await asyncio.sleep(0)
+    
+    for char_id in processing_characters:
+        existing_state.character_states[char_id].cooldown_until = (
+            datetime.now(timezone.utc) + timedelta(minutes=15)
+        )
+    
+    return {
+        "orchestration_state": existing_state,
+        "processing_characters": processing_characters,
+        "character_reactions": [],
+        "new_conversations": [],
+        "system_messages": [],
+        "workflow_step": "cleanup",
+        "execution_time_ms": 1,
+        "success": True
+    }
+
+
+class TestCooldownConsistency:
+    """Test that cooldowns hold when several news items are processed together."""
+    
+    @pytest.mark.asyncio
+    async def test_cooldown_holds_across_batch(self, sample_news_items):
+        """A character put on cooldown by one item should not react to the rest of the batch."""
+        adapter = LangGraphOrchestrationAdapter(
+            ai_provider=Mock(),
+            initial_characters=["jovani_vazquez"]
+        )
+        
+        with patch(
+            "app.adapters.langgraph_orchestration_adapter.execute_orchestration_cycle",
+            side_effect=fake_orchestration_cycle
+        ):
+            result = await adapter.process_content(
+                OrchestrationRequest(news_items=sample_news_items)
+            )
+        
+        assert result.success is True
+        assert result.performance_metrics["cycles"] == len(sample_news_items)
+        assert result.characters_processed == ["jovani_vazquez"]
+        assert not adapter.orchestration_state.pending_news_queue
+    
+    @pytest.mark.asyncio
+    async def test_cooldown_holds_across_concurrent_requests(self, sample_news_items):
+        """Concurrent requests should not each see a character as available."""
+        adapter = LangGraphOrchestrationAdapter(
+            ai_provider=Mock(),
+            initial_characters=["jovani_vazquez"]
+        )
+        
+        with patch(
+            "app.adapters.langgraph_orchestration_adapter.execute_orchestration_cycle",
+            side_effect=fake_orchestration_cycle
+        ):
+            results = await asyncio.gather(*(
+                adapter.process_content(OrchestrationRequest(news_items=[news_item]))
+                for news_item in sample_news_items
+            ))
+        
+        processed = [char_id for result in results for char_id in result.characters_processed]
+        assert processed == ["jovani_vazquez"]
@@ -0,0 +1,16 @@
+"""
+Tests for the simulated news adapter.
+"""
+from app.adapters.simulated_news_adapter import SimulatedNewsAdapter
+
+
+class TestKeyTermExtraction:
+    """Test key term extraction from news content."""
+
+    def test_keeps_apostrophe_and_hyphen_words_whole(self):
+        """Words like pa'lante and covid-19 should not be split into fragments."""
+        adapter = SimulatedNewsAdapter({})
+
+        terms = adapter._extract_key_terms("¡Pa'lante boricuas! Nuevos casos de COVID-19 en 2024")
+
+        assert terms == ["pa'lante", "boricuas", "nuevos", "casos", "covid-19"]
@@ -0,0 +1,29 @@
+"""
+Tests for the Twitter news adapter.
+"""
+from unittest.mock import Mock
+
+from app.adapters.twitter_news_adapter import TwitterNewsAdapter
+
+
+class TestKeyTermExtraction:
+    """Test key term extraction from tweet content."""
+
+    def test_keeps_apostrophe_and_hyphen_words_whole(self):
+        """Words like pa'lante and covid-19 should not be split into fragments."""
+        adapter = TwitterNewsAdapter(Mock(), Mock(), {})
+
+        terms = adapter._extract_key_terms("¡pa'lante boricuas! nuevos casos de covid-19 en san juan")
+
+        assert "pa'lante" in terms
+        assert "covid-19" in terms
+        assert "lante" not in terms
+        assert "covid" not in terms
+
+    def test_skips_urls_mentions_and_short_words(self):
+        """URLs, mentions and words under four characters should not become terms."""
+        adapter = TwitterNewsAdapter(Mock(), Mock(), {})
+
+        terms = adapter._extract_key_terms("@elnuevodia noticia en https://t.co/abc-defg #puertorico")
+
+        assert terms == ["noticia", "#puertorico"]
@@ -4,7 +4,7 @@ Tests for the agent factory and agent creation.
 import pytest
 from unittest.mock import Mock, patch
 
-from app.agents.agent_factory import create_agent, is_custom_agent, list_custom_agents
+from app.agents.agent_factory import create_agent, is_custom_agent, list_custom_agents, _get_personality
 from app.agents.base_character import BaseCharacterAgent
 from app.agents.jovani_vazquez import JovaniVazquezAgent
 from app.ports.ai_provider import AIProviderPort
@@ -57,4 +57,23 @@ class TestAgentFactory:
     def test_create_agent_no_personality_found(self):
         """Test error handling when no personality is found."""
         with pytest.raises(ValueError, match="No personality found for character"):
-            create_agent("nonexistent_character") 
\ No newline at end of file
+            create_agent("nonexistent_character")
+
+    def test_personality_added_after_miss_is_found(self):
+        """Test a failed personality lookup is not cached."""
+        ai_provider = Mock(spec=AIProviderPort)
+        personality = Mock(spec=PersonalityPort)
+        personality.character_id = "late_character"
+        _get_personality.cache_clear()
+
+        with patch(
+            "app.agents.agent_factory.get_personality_by_id",
+            side_effect=[None, personality]
+        ):
+            with pytest.raises(ValueError, match="No personality found for character"):
+                create_agent("late_character", ai_provider=ai_provider)
+
+            agent = create_agent("late_character", ai_provider=ai_provider)
+
+        assert agent.character_id == "late_character"
+        _get_personality.cache_clear()
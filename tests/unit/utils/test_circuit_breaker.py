@@ -0,0 +1,55 @@
+"""
+Tests for the circuit breaker utility.
+"""
+import pytest
+from unittest.mock import patch
+
+from app.utils.circuit_breaker import CircuitBreaker, CircuitState
+
+
+class TestCircuitBreaker:
+    """Test circuit breaker state transitions."""
+    
+    def test_opens_after_threshold_failures(self):
+        """Should reject requests after consecutive failures reach the threshold"""
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=30)
+        
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.allow_request()
+        
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow_request()
+    
+    def test_success_resets_failure_count(self):
+        """Should only count consecutive failures"""
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=30)
+        
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        
+        assert breaker.state == CircuitState.CLOSED
+    
+    def test_half_open_after_recovery_timeout(self):
+        """Should allow a trial request once the recovery timeout has passed"""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30)
+        
+        with patch("app.utils.circuit_breaker.time.monotonic", return_value=100.0):
+            breaker.record_failure()
+            assert not breaker.allow_request()
+        
+        with patch("app.utils.circuit_breaker.time.monotonic", return_value=130.0):
+            assert breaker.state == CircuitState.HALF_OPEN
+            assert breaker.allow_request()
+            
+            # A failed trial re-opens the circuit
+            breaker.record_failure()
+            assert breaker.state == CircuitState.OPEN
+        
+        with patch("app.utils.circuit_breaker.time.monotonic", return_value=160.0):
+            assert breaker.allow_request()
+            breaker.record_success()
+            assert breaker.state == CircuitState.CLOSED
@@ -0,0 +1,61 @@
+"""
+Tests for the in-process TTL cache.
+"""
+import pytest
+from unittest.mock import patch
+
+from app.utils.ttl_cache import TTLCache
+
+
+class TestTTLCache:
+    """Test TTL expiry and LRU eviction."""
+    
+    def test_get_returns_stored_value(self):
+        """Should return values that were set and default for missing keys"""
+        cache = TTLCache(maxsize=4, ttl=60)
+        cache.set("a", 1)
+        
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+        assert cache.get("missing", "default") == "default"
+    
+    def test_entries_expire_after_ttl(self):
+        """Should drop entries once their TTL has elapsed"""
+        cache = TTLCache(maxsize=4, ttl=10)
+        
+        with patch("app.utils.ttl_cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        
+        with patch("app.utils.ttl_cache.time.monotonic", return_value=109.0):
+            assert cache.get("a") == 1
+        
+        with patch("app.utils.ttl_cache.time.monotonic", return_value=110.0):
+            assert cache.get("a") is None
+        
+        assert len(cache) == 0
+    
+    def test_least_recently_used_entry_is_evicted(self):
+        """Should evict the least recently used entry when full"""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        
+        # Touch "a" so "b" becomes the eviction candidate
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+        
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+    
+    def test_pop_and_clear(self):
+        """Should remove single entries and clear everything"""
+        cache = TTLCache(maxsize=4, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        
+        assert cache.pop("a") == 1
+        assert cache.pop("a") is None
+        
+        cache.clear()
+        assert len(cache) == 0